@@ -12,6 +12,9 @@ class TSAccessBase:
     def write(self, _bytes):
         raise NotImplementedError
 
+    def write_many(self, chunks):
+        return [self.write(chunk) for chunk in chunks]
+
     def flush(self):
         raise NotImplementedError
 
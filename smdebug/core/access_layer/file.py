@@ -1,8 +1,11 @@
 # Standard Library
+import mmap
 import os
 import shutil
+from functools import lru_cache
 
 # First Party
+from smdebug.core.config_constants import WRITE_BUFFER_SIZE_DEFAULT, WRITE_BUFFER_SIZE_KEY
 from smdebug.core.logger import get_logger
 from smdebug.core.sagemaker_utils import is_sagemaker_job
 
@@ -13,13 +16,47 @@ NON_SAGEMAKER_TEMP_PATH_PREFIX = "/tmp"
 SAGEMAKER_TEMP_PATH_SUFFIX = ".tmp"
 
 
+def _get_dir(file_path, is_file=True):
+    return os.path.dirname(file_path) if is_file else file_path
+
+
+# remembers the directories recently created or found to exist in this process.
+# Every step writes to new directories, so only the last few are kept.
+@lru_cache(maxsize=64)
+def _make_dir(directory):
+    os.makedirs(directory, exist_ok=True)
+
+
 def ensure_dir(file_path, is_file=True):
-    if is_file:
-        directory = os.path.dirname(file_path)
-    else:
-        directory = file_path
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory, exist_ok=True)
+    directory = _get_dir(file_path, is_file)
+    if directory:
+        _make_dir(directory)
+
+
+def forget_dir(file_path, is_file=True):
+    """Makes the next ensure_dir calls check the filesystem again,
+    for when a directory may have been removed after it was ensured."""
+    _make_dir.cache_clear()
+
+
+def get_write_buffer_size():
+    """Size of the in-memory buffer in front of files opened for writing.
+    Writes smaller than this are collected and reach the file as one write."""
+    value = os.getenv(WRITE_BUFFER_SIZE_KEY)
+    if value is None:
+        return WRITE_BUFFER_SIZE_DEFAULT
+    try:
+        size = int(value)
+    except ValueError:
+        size = None
+    # 0 is unbuffered and 1 line buffered to open(), text files can not be opened with the former
+    if size is None or size <= 1:
+        get_logger().warning(
+            f"Invalid value {value} for {WRITE_BUFFER_SIZE_KEY}, it should be an integer "
+            f"greater than 1. Using the default of {WRITE_BUFFER_SIZE_DEFAULT} instead."
+        )
+        return WRITE_BUFFER_SIZE_DEFAULT
+    return size
 
 
 def get_temp_path(file_path):
@@ -33,6 +70,25 @@ def get_temp_path(file_path):
     return temp_path
 
 
+_HAS_WRITEV = hasattr(os, "writev")
+# limit on the number of buffers a single writev call accepts on Linux and macOS
+_IOV_MAX = 1024
+
+
+def _writev_all(fd, chunks):
+    """Writes all chunks to fd with as few writev calls as possible,
+    continuing after partial writes."""
+    bufs = [memoryview(c) for c in chunks if len(c)]
+    i = 0
+    while i < len(bufs):
+        written = os.writev(fd, bufs[i : i + _IOV_MAX])
+        while i < len(bufs) and written >= len(bufs[i]):
+            written -= len(bufs[i])
+            i += 1
+        if written:
+            bufs[i] = bufs[i][written:]
+
+
 WRITE_MODES = ["w", "w+", "wb", "wb+", "a", "a+", "ab", "ab+"]
 
 
@@ -42,37 +98,87 @@ class TSAccessFile(TSAccessBase):
         self.path = path
         self.mode = mode
         self.logger = get_logger()
+        self._offset = 0
+        self._data = None
         ensure_dir(path)
         if mode in WRITE_MODES:
             self.temp_path = get_temp_path(self.path)
-            ensure_dir(self.temp_path)
+            if os.path.dirname(self.temp_path) != os.path.dirname(self.path):
+                ensure_dir(self.temp_path)
             self.open(self.temp_path, mode)
         else:
             self.open(self.path, mode)
 
     def open(self, path, mode):
-        self._accessor = open(path, mode)
+        if mode in WRITE_MODES:
+            buffering = self._write_buffer_size = get_write_buffer_size()
+            try:
+                self._accessor = open(path, mode, buffering=buffering)
+            except FileNotFoundError:
+                # the directory was removed since ensure_dir last saw it
+                forget_dir(path)
+                ensure_dir(path)
+                self._accessor = open(path, mode, buffering=buffering)
+            # track the write offset ourselves, tell() forces a flush of the buffer
+            self._offset = self._accessor.seek(0, os.SEEK_END) if mode.startswith("a") else 0
+        else:
+            self._accessor = open(path, mode)
 
     def write(self, _str):
-        start = self._accessor.tell()
+        start = self._offset
         self._accessor.write(_str)
         length = len(_str)
+        self._offset += length
         return [start, length]
 
+    def write_many(self, chunks):
+        """Write all chunks with a single call to the underlying file.
+        Returns the [start, length] of each chunk, same as calling write for each of them."""
+        start = self._offset
+        positions = []
+        for chunk in chunks:
+            length = len(chunk)
+            positions.append([self._offset, length])
+            self._offset += length
+        if "b" not in self.mode:
+            self._accessor.write("".join(chunks))
+        elif _HAS_WRITEV and self._offset - start >= self._write_buffer_size:
+            # too large for the write buffer anyway, hand the chunks to the kernel
+            # in place instead of copying them into one bytes object first
+            self._accessor.flush()
+            _writev_all(self._accessor.fileno(), chunks)
+        else:
+            self._accessor.write(b"".join(chunks))
+        return positions
+
     def flush(self):
         self._accessor.flush()
 
     def close(self):
         """Close the file and move it from /tmp to a permanent directory."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._accessor.flush()
         self._accessor.close()
         if self.mode in WRITE_MODES:
-            shutil.move(self.temp_path, self.path)
+            try:
+                # single rename when the temp file is on the same filesystem
+                os.replace(self.temp_path, self.path)
+            except OSError:
+                forget_dir(self.path)
+                ensure_dir(self.path)
+                shutil.move(self.temp_path, self.path)
             self.logger.debug(
                 f"Sagemaker-Debugger: Wrote {os.path.getsize(self.path)} bytes to file {self.path}"
             )
 
     def ingest_all(self):
-        self._data = self._accessor.read()
+        try:
+            # map the file instead of copying all of it into memory, read() copies only what it returns
+            self._data = mmap.mmap(self._accessor.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files can not be mapped
+            self._data = self._accessor.read()
         self._datalen = len(self._data)
         self._position = 0
 
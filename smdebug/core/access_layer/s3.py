@@ -2,7 +2,6 @@
 import io
 import os
 import re
-import tempfile
 
 # Third Party
 import boto3
@@ -13,6 +12,9 @@ from smdebug.core.access_layer.base import TSAccessBase
 from smdebug.core.logger import get_logger
 from smdebug.core.utils import get_region
 
+# buckets which this process has already found to exist or created
+_KNOWN_BUCKETS = set()
+
 
 class TSAccessS3(TSAccessBase):
     def __init__(
@@ -35,10 +37,12 @@ class TSAccessS3(TSAccessBase):
         MB = 1024 ** 2
         self.transfer_config = TransferConfig(multipart_threshold=5 * MB)
 
-        # check if the bucket exists
-        buckets = [bucket["Name"] for bucket in self.s3_client.list_buckets()["Buckets"]]
-        if self.bucket_name not in buckets:
-            self.s3_client.create_bucket(ACL="private", Bucket=self.bucket_name)
+        # check if the bucket exists, once per bucket as a writer and reader is created per file
+        if self.bucket_name not in _KNOWN_BUCKETS:
+            buckets = [bucket["Name"] for bucket in self.s3_client.list_buckets()["Buckets"]]
+            if self.bucket_name not in buckets:
+                self.s3_client.create_bucket(ACL="private", Bucket=self.bucket_name)
+            _KNOWN_BUCKETS.add(self.bucket_name)
 
     def _init_data(self):
         if self.binary:
@@ -63,20 +67,17 @@ class TSAccessS3(TSAccessBase):
             self.logger.debug(
                 f"Sagemaker-Debugger: Writing binary data to s3://{os.path.join(self.bucket_name, self.key_name)}"
             )
-            self.s3_client.upload_fileobj(
-                io.BytesIO(self.data), self.bucket_name, self.key_name, Config=self.transfer_config
-            )
+            body = self.data
         else:
-            f = tempfile.NamedTemporaryFile(mode="w+")
             self.logger.debug(
                 f"Sagemaker-Debugger: Writing string data to s3://{os.path.join(self.bucket_name, self.key_name)}"
             )
-
-            f.write(self.data)
-            f.flush()
-            self.s3_client.upload_file(
-                f.name, self.bucket_name, self.key_name, Config=self.transfer_config
-            )
+            # upload from memory rather than through a temporary file on disk
+            body = self.data.encode("utf-8")
+        # the transfer config switches to a multipart upload for large objects
+        self.s3_client.upload_fileobj(
+            io.BytesIO(body), self.bucket_name, self.key_name, Config=self.transfer_config
+        )
 
         self.logger.debug(
             f"Sagemaker-Debugger: Wrote {len(self.data)} bytes to file "
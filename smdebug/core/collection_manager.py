@@ -7,9 +7,24 @@ from .access_layer import TSAccessFile, TSAccessS3
 from .collection import Collection
 from .utils import get_path_to_collections, is_s3, load_json_as_dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ALLOWED_PARAMS = ["collections", "_meta"]
 
 
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter than json, for instance about non string keys
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
 class CollectionManager:
     """
   CollectionManager lets you manage group of collections.
@@ -76,10 +91,10 @@ class CollectionManager:
         filename = os.path.join(get_path_to_collections(out_dir), filename)
         on_s3, bucket, obj = is_s3(filename)
         if on_s3:
-            f = TSAccessS3(bucket_name=bucket, key_name=obj, binary=False)
+            f = TSAccessS3(bucket_name=bucket, key_name=obj)
         else:
-            f = TSAccessFile(filename, "w")
-        f.write(json.dumps(self.to_json_dict()))
+            f = TSAccessFile(filename, "wb")
+        f.write(_dumps(self.to_json_dict()))
         f.close()
 
     @classmethod
@@ -33,6 +33,16 @@ INCOMPLETE_STEP_WAIT_WINDOW_KEY = "INCOMPLETE_STEP_WAIT_WINDOW"
 INCOMPLETE_STEP_WAIT_WINDOW_DEFAULT = 1000
 DEFAULT_EVENT_FILE_RETRY_LIMIT = 100
 
+TENSOR_VALUE_CACHE_SIZE_KEY = "TENSOR_VALUE_CACHE_SIZE"
+TENSOR_VALUE_CACHE_SIZE_DEFAULT = 0
+
+WRITE_BUFFER_SIZE_KEY = "WRITE_BUFFER_SIZE"
+WRITE_BUFFER_SIZE_DEFAULT = 1 << 20
+
+EVENT_QUEUE_OVERFLOW_KEY = "EVENT_QUEUE_OVERFLOW"
+EVENT_QUEUE_OVERFLOW_BLOCK = "block"
+EVENT_QUEUE_OVERFLOW_DROP = "drop"
+
 TRAINING_END_DELAY_REFRESH_KEY = "TRAINING_END_DELAY_REFRESH"
 TRAINING_END_DELAY_REFRESH_DEFAULT = 1
 
@@ -1,9 +1,12 @@
 # Standard Library
 import json
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 # Third Party
@@ -12,7 +15,11 @@ import numpy as np
 # First Party
 from smdebug.core.access_layer.s3handler import ReadObjectRequest, S3Handler
 from smdebug.core.access_layer.utils import has_training_ended
-from smdebug.core.config_constants import DEFAULT_EVENT_FILE_RETRY_LIMIT
+from smdebug.core.config_constants import (
+    DEFAULT_EVENT_FILE_RETRY_LIMIT,
+    TENSOR_VALUE_CACHE_SIZE_DEFAULT,
+    TENSOR_VALUE_CACHE_SIZE_KEY,
+)
 from smdebug.core.locations import IndexFileLocationUtils, TensorLocation
 from smdebug.core.logger import get_logger
 from smdebug.core.modes import ModeKeys
@@ -91,7 +98,9 @@ class IndexReader(ABC):
 
     It currently exposes two functions:
 
-    - fetch_tensor_value : a static function that returns the tensor value given a Tensorlocation object
+    - fetch_tensor_value : a function that returns the tensor value given a Tensorlocation object.
+    The most recently fetched values are kept in a small LRU cache, so reading the value of a tensor
+    and then its reductions for the same step reads the event file only once.
 
     - load_tensor_data_from_index_files : a function that returns a dictionary populated with data from index files
 
@@ -104,9 +113,64 @@ class IndexReader(ABC):
         )
         self.path = path
         self.logger = get_logger()
+        self._tensor_value_cache = OrderedDict()
+        self._tensor_value_cache_lock = threading.Lock()
+        self._tensor_value_cache_size = int(
+            os.getenv(TENSOR_VALUE_CACHE_SIZE_KEY, TENSOR_VALUE_CACHE_SIZE_DEFAULT)
+        )
+
+    def fetch_tensor_value(self, tensor_location: TensorLocation) -> np.ndarray:
+        return self.fetch_tensor_values([tensor_location])[0]
+
+    def fetch_tensor_values(self, tensor_locations: List[TensorLocation]) -> List[np.ndarray]:
+        """Return the values of the tensors at the given locations, in the same order.
+        A single value goes through the tensor value cache, when it is enabled.
+        Several values are fetched together in one batch, bypassing the cache, as they are
+        read for many steps at once and would only push each other out of it."""
+        if self._tensor_value_cache_size <= 0 or len(tensor_locations) != 1:
+            return self._fetch_tensor_values(tensor_locations)
+        values = [None] * len(tensor_locations)
+        to_fetch = []
+        with self._tensor_value_cache_lock:
+            for i, tensor_location in enumerate(tensor_locations):
+                key = self._tensor_value_cache_key(tensor_location)
+                if key in self._tensor_value_cache:
+                    self._tensor_value_cache.move_to_end(key)
+                    values[i] = self._copy_tensor_value(self._tensor_value_cache[key])
+                else:
+                    to_fetch.append(i)
+        if not to_fetch:
+            return values
+        fetched = self._fetch_tensor_values([tensor_locations[i] for i in to_fetch])
+        with self._tensor_value_cache_lock:
+            for i, value in zip(to_fetch, fetched):
+                key = self._tensor_value_cache_key(tensor_locations[i])
+                self._tensor_value_cache[key] = value
+                if len(self._tensor_value_cache) > self._tensor_value_cache_size:
+                    self._tensor_value_cache.popitem(last=False)
+                values[i] = self._copy_tensor_value(value)
+        return values
+
+    @staticmethod
+    def _copy_tensor_value(value):
+        # values in the cache are shared, each caller gets an array of its own to modify
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        return value
+
+    @staticmethod
+    def _tensor_value_cache_key(tensor_location: TensorLocation):
+        return tensor_location.event_file_name, tensor_location.start_idx, tensor_location.length
+
+    @staticmethod
+    def _read_tensor_value(tensor_object: bytes) -> np.ndarray:
+        tr = TensorReader(tensor_object)
+        tensor_tuple = list(tr.read_tensors())[0]  # Access the only element in the list
+        tensor_name, step, tensor_data, mode, mode_step = tensor_tuple
+        return tensor_data
 
     @abstractmethod
-    def fetch_tensor_value(self, tensor_location: TensorLocation):
+    def _fetch_tensor_values(self, tensor_locations: List[TensorLocation]) -> List[np.ndarray]:
         pass
 
     @abstractmethod
@@ -263,20 +327,28 @@ class S3IndexReader(IndexReader):
         _, _, prefix = is_s3(file)
         return prefix in set(event_files)
 
-    def fetch_tensor_value(self, tensor_location: TensorLocation) -> np.ndarray:
-        event_file_name = tensor_location.event_file_name
-
-        if not self._is_event_file_present(event_file_name):
-            self.event_file_present_loop(tensor_location)
-
-        start = tensor_location.start_idx
-        length = tensor_location.length
-        request = [ReadObjectRequest(event_file_name, int(start), int(length))]
-        res = S3Handler.get_objects(request)
-        tr = TensorReader(res[0])  # Access the only element in res
-        tensor_tuple = list(tr.read_tensors())[0]  # Access the only element in the list
-        tensor_name, step, tensor_data, mode, mode_step = tensor_tuple
-        return tensor_data
+    def _fetch_tensor_values(self, tensor_locations: List[TensorLocation]) -> List[np.ndarray]:
+        event_files = set(self.list_event_files())
+        checked = set()
+        for tensor_location in tensor_locations:
+            event_file_name = tensor_location.event_file_name
+            if event_file_name in checked:
+                continue
+            checked.add(event_file_name)
+            _, _, prefix = is_s3(event_file_name)
+            if prefix not in event_files:
+                self.event_file_present_loop(tensor_location)
+
+        # S3Handler fetches the ranges of all requests in parallel
+        requests = [
+            ReadObjectRequest(
+                tensor_location.event_file_name,
+                int(tensor_location.start_idx),
+                int(tensor_location.length),
+            )
+            for tensor_location in tensor_locations
+        ]
+        return [self._read_tensor_value(res) for res in S3Handler.get_objects(requests)]
 
     def load_tensor_data_from_index_files(
         self, start_after_key=None, range_steps=None
@@ -348,6 +420,9 @@ class S3IndexReader(IndexReader):
 
 
 class LocalIndexReader(IndexReader):
+    # maximum number of event files read concurrently by fetch_tensor_values
+    MAX_READ_THREADS = 16
+
     def __init__(self, path):
         super().__init__(path)
         self.index_file_cache = ReadIndexFilesCache()
@@ -373,23 +448,38 @@ class LocalIndexReader(IndexReader):
         start_after_index = bisect_left(event_files, start_after_key)
         return event_files[start_after_index:]
 
-    def fetch_tensor_value(self, tensor_location: TensorLocation) -> np.ndarray:
-        event_file_name = tensor_location.event_file_name
-
-        if not self._is_event_file_present(event_file_name):
-            self.event_file_present_loop(tensor_location)
-
-        start = tensor_location.start_idx
-        length = tensor_location.length
-
-        with open(event_file_name, "rb") as event_file:
-            event_file.seek(start)
-            tensor_object = event_file.read(length)
-
-        tr = TensorReader(tensor_object)
-        tensor_tuple = list(tr.read_tensors())[0]  # Access the only element in the list
-        tensor_name, step, tensor_data, mode, mode_step = tensor_tuple
-        return tensor_data
+    def _fetch_tensor_values(self, tensor_locations: List[TensorLocation]) -> List[np.ndarray]:
+        # group the locations by event file, so that each file is opened once
+        indices_by_file = {}
+        for i, tensor_location in enumerate(tensor_locations):
+            indices_by_file.setdefault(tensor_location.event_file_name, []).append(i)
+
+        def _read_event_file(event_file_name, indices):
+            if not self._is_event_file_present(event_file_name):
+                self.event_file_present_loop(tensor_locations[indices[0]])
+            values = []
+            with open(event_file_name, "rb") as event_file:
+                for i in indices:
+                    event_file.seek(tensor_locations[i].start_idx)
+                    tensor_object = event_file.read(tensor_locations[i].length)
+                    values.append(self._read_tensor_value(tensor_object))
+            return values
+
+        values = [None] * len(tensor_locations)
+        if len(indices_by_file) == 1:
+            results = [_read_event_file(*item) for item in indices_by_file.items()]
+        else:
+            num_threads = min(self.MAX_READ_THREADS, len(indices_by_file))
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                futures = [
+                    executor.submit(_read_event_file, event_file_name, indices)
+                    for event_file_name, indices in indices_by_file.items()
+                ]
+                results = [future.result() for future in futures]
+        for indices, file_values in zip(indices_by_file.values(), results):
+            for i, value in zip(indices, file_values):
+                values[i] = value
+        return values
 
     def load_tensor_data_from_index_files(
         self, start_after_key=None, range_steps=None
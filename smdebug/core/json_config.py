@@ -41,8 +41,10 @@ Example JSON config:
 """
 
 # Standard Library
+import copy
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -85,12 +87,21 @@ def get_json_config_as_dict(json_config_path) -> Dict:
         path = json_config_path
     else:
         path = os.getenv(CONFIG_FILE_PATH_ENV_STR, DEFAULT_CONFIG_FILE_PATH)
-    with open(path) as json_config_file:
-        params_dict = json.load(json_config_file)
+    stat = os.stat(path)
+    # callers may modify the returned dict, so hand out a copy of the cached one
+    params_dict = copy.deepcopy(_load_json_config(path, stat.st_mtime_ns, stat.st_size))
     get_logger().info(f"Creating hook from json_config at {path}.")
     return params_dict
 
 
+@lru_cache(maxsize=8)
+def _load_json_config(path, mtime_ns, size) -> Dict:
+    """Parses the json config file. Cached on the file's modification time and size,
+    so that creating several hooks from the same file parses it once."""
+    with open(path) as json_config_file:
+        return json.load(json_config_file)
+
+
 def get_tensorboard_dir_from_json_config() -> Optional[str]:
     """ Expects tb_json_config_path to contain { “LocalPath”: /my/tensorboard/path }.
 
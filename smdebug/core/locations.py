@@ -2,6 +2,7 @@
 import os
 import re
 from abc import ABC, abstractmethod
+from json.encoder import encode_basestring_ascii
 
 # Local
 from .logger import get_logger
@@ -23,8 +24,12 @@ class TensorLocation:
     def to_dict(self):
         return {"tensorname": self.tensorname, "start_idx": self.start_idx, "length": self.length}
 
-
-STEP_NUMBER_FORMATTING_LENGTH = "012"
+    def to_json(self):
+        # same as json.dumps(self.to_dict()), without building the dict and walking it
+        return (
+            f'{{"tensorname": {encode_basestring_ascii(self.tensorname)}, '
+            f'"start_idx": {self.start_idx}, "length": {self.length}}}'
+        )
 
 
 class EventFileLocation(ABC):
@@ -34,12 +39,12 @@ class EventFileLocation(ABC):
         self.type = None
 
     def get_step_num_str(self):
-        return str(format(self.step_num, STEP_NUMBER_FORMATTING_LENGTH))
+        return f"{self.step_num:012d}"
 
-    def get_filename(self):
-        step_num_str = self.get_step_num_str()
-        event_filename = f"{step_num_str}_{self.worker_name}.tfevents"
-        return event_filename
+    def get_filename(self, step_num_str=None):
+        if step_num_str is None:
+            step_num_str = self.get_step_num_str()
+        return f"{step_num_str}_{self.worker_name}.tfevents"
 
     @classmethod
     def match_regex(cls, s):
@@ -73,11 +78,12 @@ class TensorFileLocation(EventFileLocation):
         return os.path.join(trial_dir, "events")
 
     def get_file_location(self, trial_dir=""):
+        step_num_str = self.get_step_num_str()
+        filename = self.get_filename(step_num_str)
         if trial_dir:
-            event_key_prefix = self.get_dir(trial_dir)
-        else:
-            event_key_prefix = self.type
-        return os.path.join(event_key_prefix, self.get_step_num_str(), self.get_filename())
+            # one join rather than joining onto the result of get_dir
+            return os.path.join(trial_dir, "events", step_num_str, filename)
+        return os.path.join(self.type, step_num_str, filename)
 
     @classmethod
     def get_step_dirs(cls, trial_dir):
@@ -86,7 +92,7 @@ class TensorFileLocation(EventFileLocation):
     @classmethod
     def get_step_dir_path(cls, trial_dir, step_num):
         step_num = int(step_num)
-        return os.path.join(cls.get_dir(trial_dir), format(step_num, STEP_NUMBER_FORMATTING_LENGTH))
+        return os.path.join(cls.get_dir(trial_dir), f"{step_num:012d}")
 
 
 class TensorboardFileLocation(EventFileLocation):
@@ -114,20 +120,19 @@ class IndexFileLocationUtils:
         index_prefix_for_step = (
             step_num // IndexFileLocationUtils.MAX_INDEX_FILE_NUM_IN_INDEX_PREFIX
         )
-        return format(index_prefix_for_step, "09")
+        return f"{index_prefix_for_step:09d}"
 
     @staticmethod
     def next_index_prefix_for_step(step_num):
         index_prefix_for_step = (
             step_num // IndexFileLocationUtils.MAX_INDEX_FILE_NUM_IN_INDEX_PREFIX
         )
-        return format(index_prefix_for_step + 1, "09")
+        return f"{index_prefix_for_step + 1:09d}"
 
     @staticmethod
     def _get_index_key(trial_prefix, step_num, worker_name):
         index_prefix_for_step_str = IndexFileLocationUtils.get_index_prefix_for_step(step_num)
-        step_num_str = format(step_num, "012")
-        index_filename = format(f"{step_num_str}_{worker_name}.json")
+        index_filename = f"{step_num:012d}_{worker_name}.json"
         index_key = os.path.join(trial_prefix, "index", index_prefix_for_step_str, index_filename)
         return index_key
 
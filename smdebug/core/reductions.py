@@ -1,4 +1,5 @@
 # Standard Library
+import math
 import re
 
 # Third Party
@@ -7,13 +8,63 @@ import numpy as np
 # First Party
 from smdebug.core.reduction_config import ALLOWED_NORMS, ALLOWED_REDUCTIONS
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 REDUCTIONS_PREFIX = "smdebug/reductions/"
 
 
+if njit is not None:
+    # Compiled norm kernels for large float vectors. They read the data once
+    # and apply abs while iterating instead of allocating np.absolute(data).
+    # Reassociation lets the sums vectorize; NaN and inf keep their IEEE semantics.
+    # They are serial: hooks reduce tensors from several threads at once, and numba's default
+    # workqueue threading layer aborts the process when parallel regions run concurrently.
+    _FASTMATH_FLAGS = {"reassoc", "contract", "arcp"}
+
+    @njit(fastmath=_FASTMATH_FLAGS, cache=True)
+    def _l1(a):
+        s = 0.0
+        for i in range(a.size):
+            s += math.fabs(a[i])
+        return s
+
+    @njit(fastmath=_FASTMATH_FLAGS, cache=True)
+    def _l2(a):
+        s = 0.0
+        for i in range(a.size):
+            s += a[i] * a[i]
+        return math.sqrt(s)
+
+
+def _get_compiled_reduction(reduction_name, numpy_data):
+    """Returns the value of the reduction computed by a compiled kernel,
+    or None if there is no kernel for this reduction and data."""
+    if (
+        njit is None
+        or not isinstance(numpy_data, np.ndarray)
+        or numpy_data.dtype not in (np.float32, np.float64)
+        or numpy_data.size == 0
+        or not numpy_data.flags["C_CONTIGUOUS"]
+    ):
+        return None
+    # np.linalg.norm computes matrix norms for 2d arrays, only vectors match the kernels
+    if reduction_name not in ("l1", "l2") or numpy_data.ndim != 1:
+        return None
+    rv = _l1(numpy_data) if reduction_name == "l1" else _l2(numpy_data)
+    return numpy_data.dtype.type(rv)
+
+
 def get_numpy_reduction(reduction_name, numpy_data, abs=False):
     if reduction_name not in ALLOWED_REDUCTIONS and reduction_name not in ALLOWED_NORMS:
         raise ValueError("Invalid reduction type %s" % reduction_name)
 
+    # l1 and l2 norms are the same with or without abs
+    rv = _get_compiled_reduction(reduction_name, numpy_data)
+    if rv is not None:
+        return rv
     if abs:
         numpy_data = np.absolute(numpy_data)
     return get_basic_numpy_reduction(reduction_name, numpy_data)
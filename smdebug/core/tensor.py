@@ -1,5 +1,6 @@
 # Standard Library
 import bisect
+import heapq
 from enum import Enum
 from typing import Dict, Tuple
 
@@ -30,93 +31,166 @@ class StepState(Enum):
 class ModeSteps:
     """Contains a ModeKey and a dictionary mapping step numbers to a dictionary of workers to steps."""
 
+    __slots__ = (
+        "mode",
+        "_steps",
+        "_sorted_steps",
+        "_reduction_slots",
+        "_reduction_values",
+        "_num_reduction_rows",
+    )
+
     def __init__(self, mode):
         self.mode = mode
         self._steps = {}
+        # sorted step numbers, rebuilt lazily after a new step is added
+        self._sorted_steps = None
+
+        # reduction values of all steps of this mode are stored column-wise,
+        # one row per Step which has reduction values and one column per (red_name, abs).
+        # Cells hold the values as they were set, keeping their dtype and shape,
+        # and None where a step has no value for a reduction.
+        self._reduction_slots = {}
+        self._reduction_values = np.empty((0, 0), dtype=object)
+        self._num_reduction_rows = 0
+
+    def __len__(self):
+        return len(self._steps)
 
     def steps(self):
-        step_nums = list(self._steps.keys())
-        step_nums.sort(key=int)
-        return step_nums
+        if self._sorted_steps is None:
+            self._sorted_steps = sorted(self._steps.keys(), key=int)
+        return list(self._sorted_steps)
 
     def has_step(self, step_num):
         return step_num in self._steps
 
-    def set_step_value(self, step_num, worker, value):
-        step = Step(step_num, value=value)
-        if step_num not in self._steps:
-            self._steps[step_num] = {worker: step}
-        elif worker not in self._steps[step_num]:
-            self._steps[step_num].update({worker: step})
+    def _get_or_add_step(self, step_num, worker):
+        workers = self._steps.get(step_num)
+        if workers is None:
+            workers = self._steps[step_num] = {}
+            self._sorted_steps = None
+        s = workers.get(worker)
+        if s is None:
+            s = workers[worker] = Step(step_num, mode_steps=self)
+        return s
 
-        s = self._steps[step_num][worker]
-        s.value = value
+    def set_step_value(self, step_num, worker, value):
+        self._get_or_add_step(step_num, worker).value = value
 
     def set_step_location(self, step_num, worker, location):
-        step = Step(step_num, location=location)
-        if step_num not in self._steps:
-            self._steps[step_num] = {worker: step}
-        elif worker not in self._steps[step_num]:
-            self._steps[step_num].update({worker: step})
-
-        s = self._steps[step_num][worker]
-        s.location = location
+        self._get_or_add_step(step_num, worker).location = location
 
     def set_step_reduction_value(self, step_num, worker, red_name, abs, red_value):
-        if step_num not in self._steps:
-            s = Step(step_num)
-            self._steps[step_num] = {worker: s}
-        elif worker not in self._steps[step_num]:
-            s = Step(step_num)
-            self._steps[step_num].update({worker: s})
-        s = self._steps[step_num][worker]
-        s.set_reduction_value(red_name, abs, red_value)
+        self._get_or_add_step(step_num, worker).set_reduction_value(red_name, abs, red_value)
 
     def set_step_reduction_location(self, step_num, worker, red_name, abs, red_location):
-        if step_num not in self._steps:
-            self._steps[step_num] = {worker: Step(step_num)}
-        elif worker not in self._steps[step_num]:
-            s = Step(step_num)
-            self._steps[step_num].update({worker: s})
-        s = self._steps[step_num][worker]
-        s.set_reduction_location(red_name, abs, red_location)
+        self._get_or_add_step(step_num, worker).set_reduction_location(red_name, abs, red_location)
 
     def step(self, step_num):
         return self._steps[step_num]
 
+    def _add_reduction_row(self):
+        if self._num_reduction_rows == self._reduction_values.shape[0]:
+            num_rows = max(2 * self._num_reduction_rows, 8)
+            self._resize_reductions(num_rows, len(self._reduction_slots))
+        row = self._num_reduction_rows
+        self._num_reduction_rows += 1
+        return row
+
+    def _add_reduction_slot(self, red_name, abs):
+        slot = len(self._reduction_slots)
+        self._reduction_slots[(red_name, abs)] = slot
+        if slot == self._reduction_values.shape[1]:
+            self._resize_reductions(self._reduction_values.shape[0], slot + 1)
+        return slot
+
+    def _resize_reductions(self, num_rows, num_slots):
+        values = np.empty((num_rows, num_slots), dtype=object)
+        old_rows, old_slots = self._reduction_values.shape
+        values[:old_rows, :old_slots] = self._reduction_values
+        self._reduction_values = values
+
+    def reduction_value(self, row, red_name, abs):
+        slot = self._reduction_slots.get((red_name, abs))
+        if row is None or slot is None:
+            return None
+        return self._reduction_values[row, slot]
+
+    def reduction_values(self, row):
+        if row is None:
+            return {}
+        values = self._reduction_values[row]
+        return {
+            key: values[slot]
+            for key, slot in self._reduction_slots.items()
+            if values[slot] is not None
+        }
+
+    def set_reduction_value(self, row, red_name, abs, red_value):
+        slot = self._reduction_slots.get((red_name, abs))
+        if slot is None:
+            slot = self._add_reduction_slot(red_name, abs)
+        self._reduction_values[row, slot] = red_value
+
 
 class Step:
     """Contains the step number, value, location, and reduction values/locations."""
 
-    def __init__(self, step_num, value=None, location=None):
+    # a trial can hold one Step per tensor, step and worker, so avoid a __dict__ per instance
+    __slots__ = (
+        "step_num",
+        "value",
+        "location",
+        "_mode_steps",
+        "_reduction_row",
+        "_reduction_locations",
+    )
+
+    def __init__(self, step_num, value=None, location=None, mode_steps=None):
         self.step_num = step_num
         self.value = value
         self.location = location
 
-        # mapping from (red_name, abs) to value
-        self._reduction_values = {}
-        self._reduction_locations = {}
+        # reduction values are stored in the ModeSteps this step belongs to,
+        # in the row assigned to this step when its first reduction value is set.
+        # A Step created on its own gets a ModeSteps of its own then.
+        self._mode_steps = mode_steps
+        self._reduction_row = None
+        # mapping from (red_name, abs) to location, created when the first one is set
+        self._reduction_locations = None
 
     def reduction_values(self) -> Dict[Tuple[str, bool], np.ndarray]:
         """Return a dictionary mapping reduction tuples to floats."""
-        return self._reduction_values
+        if self._reduction_row is None:
+            return {}
+        return self._mode_steps.reduction_values(self._reduction_row)
 
     def reduction_value(self, red_name: str, abs: bool) -> np.ndarray:
         """Return the value for a single reduction as a NumPy array."""
-        if (red_name, abs) in self._reduction_values:
-            return self._reduction_values[(red_name, abs)]
+        if self._reduction_row is None:
+            return None
+        return self._mode_steps.reduction_value(self._reduction_row, red_name, abs)
 
     def reduction_locations(self) -> Dict[Tuple[str, bool], TensorLocation]:
+        if self._reduction_locations is None:
+            return {}
         return self._reduction_locations
 
     def reduction_location(self, red_name: str, abs: bool) -> TensorLocation:
-        if (red_name, abs) in self._reduction_locations:
-            return self._reduction_locations[(red_name, abs)]
+        if self._reduction_locations is not None:
+            return self._reduction_locations.get((red_name, abs))
 
     def set_reduction_value(self, red_name: str, abs: bool, red_value: np.ndarray):
-        self._reduction_values[(red_name, abs)] = red_value
+        if self._reduction_row is None:
+            if self._mode_steps is None:
+                self._mode_steps = ModeSteps(None)
+            self._reduction_row = self._mode_steps._add_reduction_row()
+        self._mode_steps.set_reduction_value(self._reduction_row, red_name, abs, red_value)
 
     def set_reduction_location(self, red_name: str, abs: bool, red_location: TensorLocation):
+        if self._reduction_locations is None:
+            self._reduction_locations = {}
         self._reduction_locations[(red_name, abs)] = red_location
 
 
@@ -128,6 +202,9 @@ class Tensor:
         self.name = name
         self.trial = trial
         self.cache = cache
+        # global steps and the number of steps per mode they were computed from
+        self._cached_global_steps = None
+        self._cached_global_steps_key = None
 
     def steps(self, mode=ModeKeys.GLOBAL, show_incomplete_steps=False) -> list:
         """
@@ -166,19 +243,24 @@ class Tensor:
             return []
 
     def _global_steps(self):
-        gs = []
-        for mode in self._mode_steps:
-            ms = self._mode_steps[mode].steps()
-            for s in ms:
-                gs.append(self.trial.global_step(mode, s))
-        gs.sort(key=int)
-        return gs
+        key = tuple((mode, len(mode_steps)) for mode, mode_steps in self._mode_steps.items())
+        if key != self._cached_global_steps_key:
+            # steps of a mode are sorted and map to increasing global steps,
+            # so the global steps are a k-way merge of the per mode lists
+            self._cached_global_steps = list(
+                heapq.merge(
+                    *(
+                        [self.trial.global_step(mode, s) for s in mode_steps.steps()]
+                        for mode, mode_steps in self._mode_steps.items()
+                    )
+                )
+            )
+            self._cached_global_steps_key = key
+        return list(self._cached_global_steps)
 
     def _has_mode_step_currently(self, step_num, mode):
-        if mode in self._mode_steps:
-            if self._mode_steps[mode].has_step(step_num):
-                return True
-        return False
+        mode_steps = self._mode_steps.get(mode)
+        return mode_steps is not None and mode_steps.has_step(step_num)
 
     def _get_step_dict(self, step_num, mode):
         if (
@@ -230,10 +312,7 @@ class Tensor:
                 raise StepUnavailable(step_num, mode)
             elif ss == StepState.NOT_YET_AVAILABLE:
                 if self.trial.loaded_all_steps is True:
-                    last_step = -1
-                    avail_steps = self.trial.steps(mode=mode)
-                    if len(avail_steps) > 0:
-                        last_step = avail_steps[-1]
+                    last_step = self.trial._last_step(mode=mode)
                     raise NoMoreData(
                         "Looking for step:{} for mode {} and reached end of training. Max step available is {}".format(
                             step_num, mode, last_step
@@ -242,10 +321,29 @@ class Tensor:
                 raise StepNotYetAvailable(step_num, mode)
         assert False, "Should not happen"
 
-    def values(self, mode=ModeKeys.GLOBAL, worker=None):
+    def values(self, mode=ModeKeys.GLOBAL, worker=None, steps=None):
+        """
+        Returns the values of the tensor for the given steps, or for all steps of the mode.
+        Values which are not yet in memory are fetched together in one batch.
+        """
+        if steps is None:
+            steps = self.steps(mode=mode)
         res = {}
-        for step in self.steps(mode=mode):
-            res[step] = self.value(step_num=step, mode=mode, worker=worker)
+        to_fetch = []
+        for step in steps:
+            s = self._step(step_num=step, mode=mode, worker=worker)
+            if s.value is not None:
+                res[step] = s.value
+            elif s.location is not None:
+                res[step] = None
+                to_fetch.append((step, s))
+            else:
+                self._raise_value_unavailable(s, step, mode)
+        values = self.trial.index_reader.fetch_tensor_values([s.location for _, s in to_fetch])
+        for (step, s), value in zip(to_fetch, values):
+            if self.cache:
+                s.value = value
+            res[step] = value
         return res
 
     def value(self, step_num, mode=ModeKeys.GLOBAL, worker=None):
@@ -259,10 +357,13 @@ class Tensor:
                 s.value = value
             return value
         else:
-            has_reduction_values = len(s.reduction_values()) > 0
-            has_reduction_locations = len(s.reduction_locations()) > 0
-            has_reductions = has_reduction_locations or has_reduction_values
-            raise TensorUnavailableForStep(self.name, step_num, mode, has_reductions)
+            self._raise_value_unavailable(s, step_num, mode)
+
+    def _raise_value_unavailable(self, s, step_num, mode):
+        has_reduction_values = len(s.reduction_values()) > 0
+        has_reduction_locations = len(s.reduction_locations()) > 0
+        has_reductions = has_reduction_locations or has_reduction_values
+        raise TensorUnavailableForStep(self.name, step_num, mode, has_reductions)
 
     def reduction_values(self, step_num, mode=ModeKeys.GLOBAL, worker=None):
         s = self._step(step_num=step_num, mode=mode, worker=worker)
@@ -359,8 +460,7 @@ class Tensor:
         """
         steps = self.steps(mode=mode)
         i = bisect.bisect_right(steps, step)
-        prev_steps = steps[:i]
         if n:
-            return prev_steps[-n:]
+            return steps[max(0, i - n) : i]
         else:
-            return prev_steps
+            return steps[:i]
@@ -29,16 +29,26 @@ from smdebug.core.tfrecord.record_reader import RecordReader
 from .proto.event_pb2 import Event
 
 
+_INTERN_TABLE = {
+    types_pb2.DT_HALF: np.float16,
+    types_pb2.DT_FLOAT: np.float32,
+    types_pb2.DT_DOUBLE: np.float64,
+    types_pb2.DT_INT8: np.int8,
+    types_pb2.DT_INT16: np.int16,
+    types_pb2.DT_INT32: np.int32,
+    types_pb2.DT_INT64: np.int64,
+    types_pb2.DT_UINT8: np.uint8,
+    types_pb2.DT_UINT16: np.uint16,
+    types_pb2.DT_UINT32: np.uint32,
+    types_pb2.DT_UINT64: np.uint64,
+    types_pb2.DT_COMPLEX64: np.complex64,
+    types_pb2.DT_COMPLEX128: np.complex128,
+    types_pb2.DT_STRING: np.str,
+    types_pb2.DT_BOOL: np.bool,
+}
+
+
 def as_dtype(t):
-    _INTERN_TABLE = {
-        types_pb2.DT_HALF: np.float16,
-        types_pb2.DT_FLOAT: np.float32,
-        types_pb2.DT_DOUBLE: np.float64,
-        types_pb2.DT_INT32: np.int32,
-        types_pb2.DT_INT64: np.int64,
-        types_pb2.DT_STRING: np.str,
-        types_pb2.DT_BOOL: np.bool,
-    }
     return _INTERN_TABLE[t]
 
 
@@ -18,14 +18,19 @@
 """Writes events to disk in a trial dir."""
 
 # Standard Library
+import collections
+import os
 import threading
 import time
 
-# Third Party
-import six
-
 # First Party
+from smdebug.core.config_constants import (
+    EVENT_QUEUE_OVERFLOW_BLOCK,
+    EVENT_QUEUE_OVERFLOW_DROP,
+    EVENT_QUEUE_OVERFLOW_KEY,
+)
 from smdebug.core.locations import TensorLocation
+from smdebug.core.logger import get_logger
 from smdebug.core.tfevent.events_writer import EventsWriter
 from smdebug.core.tfevent.index_file_writer import EventWithIndex
 from smdebug.core.tfevent.proto.event_pb2 import Event
@@ -43,6 +48,67 @@ def _get_sentinel_event():
     return Event()
 
 
+def _serialize_event(event):
+    if not isinstance(event, Event):
+        raise TypeError("expected an event_pb2.Event proto, " " but got %s" % type(event))
+    return event.SerializeToString()
+
+
+class _EventQueue:
+    """Queue of pending events, drained as a whole by the logger thread.
+    A deque guarded by a single condition, so the consumer pays one lock round trip
+    per batch of events rather than per event.
+    max_size <= 0 means the queue is unbounded, like queue.Queue."""
+
+    def __init__(self, max_size=0):
+        self._events = collections.deque()
+        self._cv = threading.Condition()
+        self._max_size = max_size
+        # events put and not yet marked done, including those being written
+        self._unfinished = 0
+        self.num_dropped = 0
+
+    def put(self, event, block=True):
+        """Adds the event to the queue. When the queue is full, waits for room if block is True,
+        otherwise drops the event and returns False."""
+        with self._cv:
+            while 0 < self._max_size <= len(self._events):
+                if not block:
+                    self.num_dropped += 1
+                    return False
+                self._cv.wait()
+            self._events.append(event)
+            self._unfinished += 1
+            self._cv.notify_all()
+        return True
+
+    def get_all(self):
+        """Blocks until there are events, then removes and returns all of them."""
+        with self._cv:
+            while not self._events:
+                self._cv.wait()
+            events = list(self._events)
+            self._events.clear()
+            self._cv.notify_all()
+        return events
+
+    def task_done(self, num_events=1):
+        with self._cv:
+            self._unfinished -= num_events
+            if self._unfinished <= 0:
+                self._cv.notify_all()
+
+    def join(self):
+        """Blocks until all events put have been marked done."""
+        with self._cv:
+            while self._unfinished > 0:
+                self._cv.wait()
+
+    def is_idle(self):
+        """Whether every event put has been written, none is queued or being written."""
+        return self._unfinished == 0
+
+
 class EventFileWriter:
     """This class is adapted from EventFileWriter in Tensorflow:
     https://github.com/tensorflow/tensorflow/blob/master/tensorflow/python/summary/writer/event_file_writer.py
@@ -60,6 +126,7 @@ class EventFileWriter:
         index_writer=None,
         verbose=False,
         write_checksum=False,
+        queue_overflow=None,
     ):
         """Creates a `EventFileWriter` and an event file to write to.
         On construction the summary writer creates a new event file in `logdir`.
@@ -67,9 +134,21 @@ class EventFileWriter:
         disk via the add_event method.
         The other arguments to the constructor control the asynchronous writes to
         the event file:
+        queue_overflow is what happens to events written while max_queue events are queued,
+        "block" waits for room in the queue and "drop" drops the event. It defaults to
+        the EVENT_QUEUE_OVERFLOW environment variable, or "block".
         """
         self._path = path
-        self._event_queue = six.moves.queue.Queue(max_queue)
+        self._logger = get_logger()
+        self._event_queue = _EventQueue(max_queue)
+        if queue_overflow is None:
+            queue_overflow = os.getenv(EVENT_QUEUE_OVERFLOW_KEY, EVENT_QUEUE_OVERFLOW_BLOCK)
+        if queue_overflow not in (EVENT_QUEUE_OVERFLOW_BLOCK, EVENT_QUEUE_OVERFLOW_DROP):
+            raise ValueError(
+                f"queue_overflow must be {EVENT_QUEUE_OVERFLOW_BLOCK} or "
+                f"{EVENT_QUEUE_OVERFLOW_DROP}, but got {queue_overflow}"
+            )
+        self._block_when_full = queue_overflow == EVENT_QUEUE_OVERFLOW_BLOCK
         self._ev_writer = EventsWriter(
             path=self._path,
             index_writer=index_writer,
@@ -90,39 +169,72 @@ class EventFileWriter:
     def write_graph(self, graph):
         """Adds a `Graph` protocol buffer to the event file."""
         event = Event(graph_def=graph.SerializeToString())
-        self.write_event(event)
+        # events built here need not go through the type check of write_event
+        self.write_serialized_event(event.SerializeToString())
 
     def write_summary(self, summary, step):
         event = Event(summary=summary)
         event.wall_time = time.time()
         event.step = step
-        self.write_event(event)
+        self.write_serialized_event(event.SerializeToString())
 
     def write_summary_with_index(self, summary, step, tname, mode, mode_step):
         event = Event(summary=summary)
         event.wall_time = time.time()
         event.step = step
-        return self.write_event(EventWithIndex(event, tname, mode, mode_step))
+        self.write_serialized_event_with_index(event.SerializeToString(), tname, mode, mode_step)
+
+    def write_serialized_event_with_index(self, event_str, tname, mode, mode_step):
+        """Adds a serialized event holding the tensor tname to the event file,
+        and the location of the event to the index."""
+        self._put(EventWithIndex(event_str, tname, mode, mode_step))
 
     def write_event(self, event):
-        """Adds an event to the event file."""
-        self._event_queue.put(event)
+        """Adds an event to the event file.
+        The event is serialized here, in the caller's thread, so that the logger thread
+        only writes bytes and threads writing events can serialize them in parallel."""
+        self._put(_serialize_event(event))
+
+    def write_serialized_event(self, event_str):
+        """Like write_event, for an event which is already serialized."""
+        self._put(event_str)
+
+    def _put(self, event):
+        # when the logger thread has nothing to do, write the event right here
+        # rather than waking the thread up for it
+        if self._worker.write_if_idle(event):
+            return
+        if not self._event_queue.put(event, block=self._block_when_full):
+            if self._event_queue.num_dropped == 1:
+                self._logger.warning(
+                    f"The event queue of {self._path} is full, events are being dropped"
+                )
+
+    @property
+    def num_dropped_events(self):
+        """Number of events dropped because the queue was full."""
+        return self._event_queue.num_dropped
 
     def flush(self):
         """Flushes the event file to disk.
         Call this method to make sure that all pending events have been written to disk.
         """
         self._event_queue.join()
-        self._ev_writer.flush()
+        self._worker.flush()
 
     def close(self):
         """Flushes the event file to disk and close the file.
         Call this method when you do not need the summary writer anymore.
         """
-        self.write_event(self._sentinel_event)
+        self._event_queue.put(self._sentinel_event)
         self.flush()
         self._worker.join()
         self._ev_writer.close()
+        if self.num_dropped_events:
+            self._logger.warning(
+                f"Dropped {self.num_dropped_events} events written to {self._path} "
+                f"while the event queue was full"
+            )
 
     def name(self):
         return self._ev_writer.name()
@@ -142,44 +254,90 @@ class _EventLoggerThread(threading.Thread):
         # The first event will be flushed immediately.
         self._next_event_flush_time = 0
         self._sentinel_event = sentinel_event
+        # event file name and worker recorded in index entries, the same for every event
+        self._index_event_file_name = None
+        self._index_worker = None
+        # held while writing events, by this thread or by a thread writing an event inline
+        self._write_lock = threading.Lock()
+        self._stopped = False
+
+    def _get_index_event_file_and_worker(self):
+        if self._index_event_file_name is None:
+            eventfile = get_relative_event_file_path(self._ev_writer.name())
+            self._index_worker = parse_worker_name_from_file(eventfile)
+            self._index_event_file_name = eventfile
+        return self._index_event_file_name, self._index_worker
 
     def run(self):
         while True:
-            event_in_queue = self._queue.get()
+            events_in_queue = self._queue.get_all()
+            try:
+                with self._write_lock:
+                    stop = self._write_events(events_in_queue)
+                    self._stopped = stop
+            finally:
+                self._queue.task_done(len(events_in_queue))
+            if stop:
+                break
+
+    def write_if_idle(self, event):
+        """Writes the event in the calling thread if no events are queued or being written.
+        Events queued earlier are always written first, so the order of events is kept.
+        Returns False if the event was not written, it should then be queued."""
+        if not self._queue.is_idle() or not self._write_lock.acquire(blocking=False):
+            return False
+        try:
+            if self._stopped:
+                return False
+            self._write_events([event])
+        finally:
+            self._write_lock.release()
+        return True
 
+    def flush(self):
+        with self._write_lock:
+            self._ev_writer.flush()
+
+    def _write_events(self, events_in_queue):
+        """Writes a batch of serialized events taken off the queue and their index entries.
+        Returns True if the batch contained the sentinel event."""
+        event_strs = []
+        indexed = []
+        stop = False
+        for event_in_queue in events_in_queue:
+            if event_in_queue is self._sentinel_event:
+                stop = True
+                break
             if isinstance(event_in_queue, EventWithIndex):
                 # checking whether there is an object of EventWithIndex,
                 # which is written by write_summary_with_index
-                event = event_in_queue.event
+                indexed.append((len(event_strs), event_in_queue))
+                event_strs.append(event_in_queue.event)
             else:
-                event = event_in_queue
+                event_strs.append(event_in_queue)
 
-            if event is self._sentinel_event:
-                self._queue.task_done()
-                break
-            try:
-                # write event
-                positions = self._ev_writer.write_event(event)
+        if event_strs:
+            # write events
+            positions = self._ev_writer.write_serialized_events(event_strs)
 
-                # write index
-                if isinstance(event_in_queue, EventWithIndex):
-                    eventfile = self._ev_writer.name()
-                    eventfile = get_relative_event_file_path(eventfile)
+            # write index
+            if indexed:
+                eventfile, worker = self._get_index_event_file_and_worker()
+                for i, event_in_queue in indexed:
                     tensorlocation = TensorLocation(
                         tname=event_in_queue.tensorname,
                         mode=event_in_queue.get_mode(),
                         mode_step=event_in_queue.mode_step,
                         event_file_name=eventfile,
-                        start_idx=positions[0],
-                        length=positions[1],
-                        worker=parse_worker_name_from_file(eventfile),
+                        start_idx=positions[i][0],
+                        length=positions[i][1],
+                        worker=worker,
                     )
                     self._ev_writer.index_writer.add_index(tensorlocation)
-                # Flush the event writer every so often.
-                now = time.time()
-                if now > self._next_event_flush_time:
-                    self._ev_writer.flush()
-                    # Do it again in two minutes.
-                    self._next_event_flush_time = now + self._flush_secs
-            finally:
-                self._queue.task_done()
+            # Flush the event writer every so often.
+            now = time.time()
+            if now > self._next_event_flush_time:
+                self._ev_writer.flush()
+                # Do it again in two minutes.
+                self._next_event_flush_time = now + self._flush_secs
+        return stop
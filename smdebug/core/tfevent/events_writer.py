@@ -18,9 +18,6 @@ class EventsWriter:
         self.write_checksum = write_checksum
         self.index_writer = index_writer
 
-    def __del__(self):
-        self.close()
-
     def _init_if_needed(self):
         if self.tfrecord_writer is not None:
             return
@@ -43,6 +40,14 @@ class EventsWriter:
         position_and_length_of_record = self.tfrecord_writer.write_record(event_str)
         return position_and_length_of_record
 
+    def write_serialized_events(self, event_strs):
+        """Appends a batch of serialized events to the file.
+        Returns the position and length of each event's record."""
+        if self.tfrecord_writer is None:
+            self._init_if_needed()
+        self._num_outstanding_events += len(event_strs)
+        return self.tfrecord_writer.write_records(event_strs)
+
     def flush(self):
         """Flushes the event file to disk."""
         if self._num_outstanding_events == 0 or self.tfrecord_writer is None:
@@ -9,7 +9,8 @@ from smdebug.core.utils import is_s3
 
 class IndexWriter(object):
     def __init__(self, file_path):
-        """ Writer is initialized upon adding the first index. """
+        """ Index entries are kept in memory for the step and written out in one go
+        by flush, which is also when the writer is initialized. """
         self.file_path = file_path
         self.index_payload = []
         self.index_meta = {}
@@ -26,20 +27,16 @@ class IndexWriter(object):
             self.writer = TSAccessFile(self.file_path, "a+")
 
     def add_index(self, tensorlocation):
-        if not self.writer:
-            self._init_writer()
         if not self.index_meta:
             self.index_meta = {
                 "mode": tensorlocation.mode,
                 "mode_step": tensorlocation.mode_step,
                 "event_file_name": tensorlocation.event_file_name,
             }
-        self.index_payload.append(tensorlocation.to_dict())
+        self.index_payload.append(tensorlocation.to_json())
 
     def flush(self):
         """Flushes the event string to file."""
-        if not self.writer:
-            raise ValueError(f"Cannot flush because self.writer={self.writer}")
         if not self.index_meta:
             raise ValueError(
                 f"Cannot write empty index_meta={self.index_meta} to file {self.file_path}"
@@ -50,27 +47,32 @@ class IndexWriter(object):
             )
 
         index = Index(meta=self.index_meta, tensor_payload=self.index_payload)
+        if not self.writer:
+            self._init_writer()
         self.writer.write(index.to_json())
         self.writer.flush()
         self.index_meta = {}
-        self.index_payload = {}
+        self.index_payload = []
 
     def close(self):
         """Closes the record writer."""
+        if self.index_meta and self.index_payload:
+            self.flush()
         if self.writer is not None:
-            if self.index_meta and self.index_payload:
-                self.flush()
-                self.writer.close()
-                self.writer = None
+            self.writer.close()
+            self.writer = None
 
 
 class Index:
     def __init__(self, meta=None, tensor_payload=None):
+        """ tensor_payload holds the entries for the tensors already encoded as JSON,
+        by TensorLocation.to_json """
         self.meta = meta
         self.tensor_payload = tensor_payload
 
     def to_json(self):
-        return json.dumps({"meta": self.meta, "tensor_payload": self.tensor_payload})
+        tensor_payload = ", ".join(self.tensor_payload)
+        return f'{{"meta": {json.dumps(self.meta)}, "tensor_payload": [{tensor_payload}]}}'
 
 
 class EventWithIndex(object):
@@ -1,19 +1,26 @@
+# Standard Library
+import struct
+
 # Third Party
 import numpy as np
+from google.protobuf.internal.encoder import TagBytes
+from google.protobuf.internal.wire_format import WIRETYPE_FIXED64 as _FIXED64
+from google.protobuf.internal.wire_format import WIRETYPE_LENGTH_DELIMITED as _DELIMITED
+from google.protobuf.internal.wire_format import WIRETYPE_VARINT as _VARINT
 
 # First Party
 from smdebug.core.logger import get_logger
 
 # Local
+from .proto import types_pb2
 from .proto.tensor_pb2 import TensorProto
-from .proto.tensor_shape_pb2 import TensorShapeProto
 
 logger = get_logger()
 
 # hash value of ndarray.dtype is not the same as np.float class
 # so we need to convert the type classes below to np.dtype object
 _NP_DATATYPE_TO_PROTO_DATATYPE = {
-    np.dtype(np.float16): "DT_INT32",
+    np.dtype(np.float16): "DT_HALF",
     np.dtype(np.float32): "DT_FLOAT",
     np.dtype(np.float64): "DT_DOUBLE",
     np.dtype(np.int32): "DT_INT32",
@@ -36,33 +43,117 @@ def _get_proto_dtype(npdtype):
     return (True, _NP_DATATYPE_TO_PROTO_DATATYPE[npdtype])
 
 
-def make_tensor_proto(nparray_data, tag):
+def make_tensor_proto(nparray_data, tag, tensor_proto=None):
+    """Returns a TensorProto holding nparray_data.
+    When tensor_proto is given, it is filled in place rather than creating a new message,
+    so that a tensor nested in a larger message does not have to be copied into it."""
     (isnum, dtype) = _get_proto_dtype(nparray_data.dtype)
-    dimensions = [
-        TensorShapeProto.Dim(size=d, name="{0}_{1}".format(tag, d)) for d in nparray_data.shape
-    ]
-    tps = TensorShapeProto(dim=dimensions)
+    if tensor_proto is None:
+        tensor_proto = TensorProto()
+    # the shape is present even for a 0-d tensor, which has no dims
+    tensor_proto.tensor_shape.SetInParent()
+    for d in nparray_data.shape:
+        tensor_proto.tensor_shape.dim.add(size=d, name=f"{tag}_{d}")
     if isnum:
-        tensor_proto = TensorProto(
-            dtype=dtype, tensor_content=nparray_data.tostring(), tensor_shape=tps
-        )
+        tensor_proto.dtype = types_pb2.DataType.Value(dtype)
+        # protobuf only accepts bytes here, tobytes is the one copy of the data
+        tensor_proto.tensor_content = nparray_data.tobytes()
     else:
-        tensor_proto = TensorProto(tensor_shape=tps)
         for s in nparray_data:
             sb = bytes(s, encoding="utf-8")
             tensor_proto.string_val.append(sb)
     return tensor_proto
 
 
+# tags of the fields set by serialize_tensor_event, in the order protobuf writes them
+_EVENT_WALL_TIME = TagBytes(1, _FIXED64)
+_EVENT_STEP = TagBytes(2, _VARINT)
+_EVENT_SUMMARY = TagBytes(5, _DELIMITED)
+_SUMMARY_VALUE = TagBytes(1, _DELIMITED)
+_VALUE_TAG = TagBytes(1, _DELIMITED)
+_VALUE_TENSOR = TagBytes(8, _DELIMITED)
+_VALUE_METADATA = TagBytes(9, _DELIMITED)
+_TENSOR_DTYPE = TagBytes(1, _VARINT)
+_TENSOR_SHAPE = TagBytes(2, _DELIMITED)
+_TENSOR_CONTENT = TagBytes(4, _DELIMITED)
+_SHAPE_DIM = TagBytes(2, _DELIMITED)
+_DIM_SIZE = TagBytes(1, _VARINT)
+_DIM_NAME = TagBytes(2, _DELIMITED)
+
+
+def _varint(value):
+    # numpy integers are accepted like protobuf does,
+    # and negative int64 values are written as ten byte varints
+    value = int(value) & 0xFFFFFFFFFFFFFFFF
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _delimited(tag, payload):
+    return tag + _varint(len(payload)) + payload
+
+
+def serialize_tensor_event(wall_time, step, tag, metadata, nparray_data):
+    """Returns the serialized bytes of the Event that FileWriter.write_tensor would build,
+    with the tensor nparray_data in a summary value named tag.
+    metadata is the serialized SummaryMetadata of the value.
+    The wire format is written directly, skipping the construction and generic serialization
+    of the protobuf messages. Fields are written in field number order and fields holding
+    default values are left out, so the bytes are the same as those of SerializeToString.
+    Returns None for tensors which are not numeric, those are written through make_tensor_proto."""
+    (isnum, dtype) = _get_proto_dtype(nparray_data.dtype)
+    if not isnum:
+        return None
+    content = nparray_data.tobytes()
+    tag_bytes = tag.encode("utf-8")
+
+    shape = b"".join(
+        _delimited(
+            _SHAPE_DIM,
+            (_DIM_SIZE + _varint(d) if d else b"")
+            + _delimited(_DIM_NAME, f"{tag}_{d}".encode("utf-8")),
+        )
+        for d in nparray_data.shape
+    )
+    tensor_head = (
+        _TENSOR_DTYPE + _varint(types_pb2.DataType.Value(dtype)) + _delimited(_TENSOR_SHAPE, shape)
+    )
+    if content:
+        tensor_head += _TENSOR_CONTENT + _varint(len(content))
+    tensor_size = len(tensor_head) + len(content)
+
+    value_head = _delimited(_VALUE_TAG, tag_bytes) if tag_bytes else b""
+    value_head += _VALUE_TENSOR + _varint(tensor_size)
+    value_tail = _delimited(_VALUE_METADATA, metadata)
+    value_size = len(value_head) + tensor_size + len(value_tail)
+
+    summary_head = _SUMMARY_VALUE + _varint(value_size)
+    summary_size = len(summary_head) + value_size
+
+    event_head = b""
+    if wall_time:
+        event_head += _EVENT_WALL_TIME + struct.pack("<d", wall_time)
+    if step:
+        event_head += _EVENT_STEP + _varint(step)
+    event_head += _EVENT_SUMMARY + _varint(summary_size)
+    # the tensor content is copied only once, by this join
+    return b"".join((event_head, summary_head, value_head, tensor_head, content, value_tail))
+
+
 def make_numpy_array(x):
     if isinstance(x, np.ndarray):
         return x
     elif np.isscalar(x):
         return np.array([x])
-    elif isinstance(x, tuple):
-        return np.asarray(x, dtype=x.dtype)
+    elif isinstance(x, (tuple, list)):
+        # tuples have no dtype, let numpy infer it
+        return np.asarray(x)
     else:
         raise TypeError(
-            "_make_numpy_array only accepts input types of numpy.ndarray, scalar,"
+            "_make_numpy_array only accepts input types of numpy.ndarray, scalar, tuple, list,"
             " while received type {}".format(str(type(x)))
         )
@@ -20,6 +20,15 @@ https://github.com/TeamHG-Memex/tensorboard_logger/blob/master/tensorboard_logge
 # Standard Library
 import array
 
+try:
+    # C implementations, which use the CRC32 instruction of the CPU when there is one
+    from crc32c import crc32c as _native_crc32c
+except ImportError:
+    try:
+        from google_crc32c import value as _native_crc32c
+    except ImportError:
+        _native_crc32c = None
+
 # CRC table copied from table0_ in
 # https://github.com/tensorflow/tensorflow/blob/master/tensorflow/core/lib/hash/crc32c.cc
 CRC_TABLE = (
@@ -348,4 +357,6 @@ def crc32c(data):
     int
         32-bit CRC-32C checksum of data as long.
     """
+    if _native_crc32c is not None:
+        return _native_crc32c(data)
     return crc_finalize(crc_update(_CRC_INIT, data))
@@ -21,7 +21,7 @@ import struct
 # First Party
 from smdebug.core.access_layer.file import TSAccessFile
 from smdebug.core.access_layer.s3 import TSAccessS3
-from smdebug.core.tfrecord.record_writer import CHECKSUM_MAGIC_BYTES
+from smdebug.core.tfrecord.record_writer import CHECKSUM_MAGIC_CRC
 from smdebug.core.utils import is_s3
 
 # Local
@@ -77,7 +77,7 @@ class RecordReader:
             computed_payload_crc = masked_crc32c(payload)
             assert saved_payload_crc == computed_payload_crc
         elif check == "minimal":
-            computed_payload_crc = masked_crc32c(CHECKSUM_MAGIC_BYTES)
+            computed_payload_crc = CHECKSUM_MAGIC_CRC
             assert saved_payload_crc == computed_payload_crc
         else:
             # no check
@@ -19,6 +19,7 @@
 
 # Standard Library
 import struct
+import weakref
 
 # First Party
 from smdebug.core.access_layer.file import TSAccessFile
@@ -54,21 +55,30 @@ class RecordWriter:
                 self._writer = TSAccessFile(path, "wb")
         except (OSError, IOError) as err:
             raise ValueError("failed to open {}: {}".format(path, str(err)))
+        # closes the file if the writer is garbage collected or the interpreter exits
+        # before close is called. Unlike __del__, this does not keep the writer
+        # out of the cheap path of the garbage collector
+        self._finalizer = weakref.finalize(self, _close_writer, self._writer)
 
-    def __del__(self):
-        self.close()
-
-    def write_record(self, event_str):
-        """Writes a serialized event to file."""
+    def _frame_record(self, event_str):
         header = struct.pack("Q", len(event_str))
         header += struct.pack("I", masked_crc32c(header))
         if self.write_checksum:
             footer = struct.pack("I", masked_crc32c(event_str))
         else:
-            footer = struct.pack("I", masked_crc32c(CHECKSUM_MAGIC_BYTES))
-        position_and_length_of_record = self._writer.write(header + event_str + footer)
+            footer = _CHECKSUM_MAGIC_FOOTER
+        return header + event_str + footer
+
+    def write_record(self, event_str):
+        """Writes a serialized event to file."""
+        position_and_length_of_record = self._writer.write(self._frame_record(event_str))
         return position_and_length_of_record
 
+    def write_records(self, event_strs):
+        """Writes a batch of serialized events to file in one call.
+        Returns the position and length of each record."""
+        return self._writer.write_many([self._frame_record(e) for e in event_strs])
+
     def flush(self):
         """Flushes the event string to file."""
         assert self._writer is not None
@@ -77,9 +87,14 @@ class RecordWriter:
     def close(self):
         """Closes the record writer."""
         if self._writer is not None:
-            self.flush()
-            self._writer.close()
             self._writer = None
+            # runs _close_writer at most once, and unregisters it
+            self._finalizer()
+
+
+def _close_writer(writer):
+    writer.flush()
+    writer.close()
 
 
 def masked_crc32c(data):
@@ -93,3 +108,8 @@ def u32(x):  # pylint: disable=invalid-name
     """Copied from
     https://github.com/TeamHG-Memex/tensorboard_logger/blob/master/tensorboard_logger/tensorboard_logger.py"""
     return x & 0xFFFFFFFF
+
+
+# records written without a checksum of their data all end with this checksum
+CHECKSUM_MAGIC_CRC = masked_crc32c(CHECKSUM_MAGIC_BYTES)
+_CHECKSUM_MAGIC_FOOTER = struct.pack("I", CHECKSUM_MAGIC_CRC)
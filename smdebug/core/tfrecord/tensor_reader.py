@@ -7,7 +7,7 @@ from smdebug.core.modes import MODE_PLUGIN_NAME, MODE_STEP_PLUGIN_NAME, ModeKeys
 from smdebug.core.tfevent.event_file_reader import get_tensor_data
 from smdebug.core.tfevent.proto.event_pb2 import Event
 from smdebug.core.tfrecord.record_reader import masked_crc32c
-from smdebug.core.tfrecord.record_writer import CHECKSUM_MAGIC_BYTES
+from smdebug.core.tfrecord.record_writer import CHECKSUM_MAGIC_CRC
 
 logger = get_logger()
 
@@ -40,7 +40,7 @@ class TensorReader:
             computed_payload_crc = masked_crc32c(payload)
             assert saved_payload_crc == computed_payload_crc
         elif check == "minimal":
-            computed_payload_crc = masked_crc32c(CHECKSUM_MAGIC_BYTES)
+            computed_payload_crc = CHECKSUM_MAGIC_CRC
             assert saved_payload_crc == computed_payload_crc
         else:
             # no check
@@ -5,6 +5,7 @@ import os
 import re
 import shutil
 import socket
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -116,12 +117,19 @@ def deserialize_tf_device(device_name: str) -> str:
     return device_name
 
 
+@lru_cache(maxsize=256)
+def _compile_regexes(patterns):
+    """Compiles each of a tuple of regex patterns once.
+    They are kept separate, as joining them into one alternation would renumber
+    their groups and let inline flags of one pattern apply to the others."""
+    return tuple(re.compile(p) for p in patterns)
+
+
 def match_inc(tname, include):
     """Matches anywhere in the string, doesn't require full match."""
-    for inc in include:
-        if re.search(inc, tname):
-            return True
-    return False
+    if not include:
+        return False
+    return any(regex.search(tname) for regex in _compile_regexes(tuple(include)))
 
 
 def index(sorted_list, elem):
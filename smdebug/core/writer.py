@@ -16,19 +16,22 @@
 # under the License.
 
 """APIs for logging data in the event file."""
+# Standard Library
+import time
+
 # First Party
 from smdebug.core.modes import MODE_PLUGIN_NAME, MODE_STEP_PLUGIN_NAME
 from smdebug.core.tfevent.event_file_writer import EventFileWriter
 from smdebug.core.tfevent.index_file_writer import IndexWriter
 from smdebug.core.tfevent.proto.event_pb2 import Event, TaggedRunMetadata
-from smdebug.core.tfevent.proto.summary_pb2 import Summary, SummaryMetadata
+from smdebug.core.tfevent.proto.summary_pb2 import SummaryMetadata
 from smdebug.core.tfevent.summary import (
     _get_default_bins,
     histogram_summary,
     make_numpy_array,
     scalar_summary,
 )
-from smdebug.core.tfevent.util import make_tensor_proto
+from smdebug.core.tfevent.util import make_tensor_proto, serialize_tensor_event
 
 # Local
 from .locations import IndexFileLocationUtils, TensorboardFileLocation, TensorFileLocation
@@ -102,6 +105,10 @@ class FileWriter:
             write_checksum=write_checksum,
         )
         self._default_bins = _get_default_bins()
+        # metadata of the last tensor written, reused while mode and mode_step stay the same
+        self._metadata_key = None
+        self._metadata = None
+        self._metadata_str = None
 
     def __enter__(self):
         """Make usable with "with" statement."""
@@ -121,15 +128,26 @@ class FileWriter:
 
     def write_tensor(self, tdata, tname, write_index=True, mode=ModeKeys.GLOBAL, mode_step=None):
         mode, mode_step = self._check_mode_step(mode, mode_step, self.step)
-        smd = self._get_metadata(mode, mode_step)
+        if self._metadata_key != (mode, mode_step):
+            self._metadata = self._get_metadata(mode, mode_step)
+            self._metadata_str = self._metadata.SerializeToString()
+            self._metadata_key = (mode, mode_step)
         value = make_numpy_array(tdata)
         tag = tname
-        tensor_proto = make_tensor_proto(nparray_data=value, tag=tag)
-        s = Summary(value=[Summary.Value(tag=tag, metadata=smd, tensor=tensor_proto)])
+        wall_time = time.time()
+        event_str = serialize_tensor_event(wall_time, self.step, tag, self._metadata_str, value)
+        if event_str is None:
+            # build the event in place, constructing Summary.Value, Summary and Event
+            # from one another would copy the tensor into each of them
+            event = Event(wall_time=wall_time, step=self.step)
+            summary_value = event.summary.value.add(tag=tag)
+            summary_value.metadata.CopyFrom(self._metadata)
+            make_tensor_proto(nparray_data=value, tag=tag, tensor_proto=summary_value.tensor)
+            event_str = event.SerializeToString()
         if write_index:
-            self._writer.write_summary_with_index(s, self.step, tname, mode, mode_step)
+            self._writer.write_serialized_event_with_index(event_str, tname, mode, mode_step)
         else:
-            self._writer.write_summary(s, self.step)
+            self._writer.write_serialized_event(event_str)
 
     def write_graph(self, graph):
         self._writer.write_graph(graph)
@@ -140,10 +158,10 @@ class FileWriter:
         graph = graph_profile[0]
         stepstats = graph_profile[1]
         event = Event(graph_def=graph.SerializeToString())
-        self._writer.write_event(event)
+        self._writer.write_serialized_event(event.SerializeToString())
         trm = TaggedRunMetadata(tag="step1", run_metadata=stepstats.SerializeToString())
         event = Event(tagged_run_metadata=trm)
-        self._writer.write_event(event)
+        self._writer.write_serialized_event(event.SerializeToString())
 
     def write_summary(self, summ, global_step):
         self._writer.write_summary(summ, global_step)
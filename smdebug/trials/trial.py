@@ -415,6 +415,20 @@ class Trial(ABC):
         else:
             return []
 
+    def _last_step(self, mode=ModeKeys.GLOBAL) -> int:
+        """
+        returns the largest step seen for the mode, complete or incomplete,
+        or -1 if there are no steps. Avoids sorting all the steps.
+        :param mode: ModeKeys
+        :return: int
+        """
+        self.maybe_refresh()
+        if mode == ModeKeys.GLOBAL:
+            steps = self._global_to_mode.keys()
+        else:
+            steps = self._mode_to_global.get(mode, {}).keys()
+        return max(steps, default=-1)
+
     def _global_step_currently(self, mode, mode_step):
         if mode == ModeKeys.GLOBAL:
             return mode_step
@@ -477,10 +491,7 @@ class Trial(ABC):
                         if self.loaded_all_steps is False:
                             raise StepUnavailable(step, mode)
                         else:
-                            last_step = -1
-                            avail_steps = self._all_steps(mode=mode)
-                            if len(avail_steps) > 0:
-                                last_step = avail_steps[-1]
+                            last_step = self._last_step(mode=mode)
                             if step < last_step:
                                 raise StepUnavailable(step, mode)
                             raise NoMoreData(step, mode, last_step)
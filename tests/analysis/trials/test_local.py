@@ -3,9 +3,11 @@ import os
 import uuid
 
 # Third Party
+import pytest
 from tests.analysis.utils import check_trial, generate_data
 
 # First Party
+from smdebug.core.config_constants import TENSOR_VALUE_CACHE_SIZE_KEY
 from smdebug.trials import LocalTrial
 
 
@@ -32,3 +34,87 @@ def test_local():
             rank=0,
         )
     check_local(path, trial_name, num_steps=num_steps, num_tensors=num_tensors)
+
+
+def test_local_value_and_reductions_read_once(monkeypatch):
+    monkeypatch.setenv(TENSOR_VALUE_CACHE_SIZE_KEY, "16")
+    trial_name = str(uuid.uuid4())
+    path = "ts_output/train/"
+    generate_data(
+        path=path,
+        trial=trial_name,
+        num_tensors=1,
+        step=0,
+        tname_prefix="foo",
+        worker="algo-1",
+        shape=(3, 3),
+        rank=0,
+    )
+    trial_obj = LocalTrial(name=trial_name, dirname=os.path.join(path, trial_name))
+    index_reader = trial_obj.index_reader
+    num_reads = 0
+    fetch = index_reader._fetch_tensor_values
+
+    def counting_fetch(tensor_locations):
+        nonlocal num_reads
+        num_reads += len(tensor_locations)
+        return fetch(tensor_locations)
+
+    index_reader._fetch_tensor_values = counting_fetch
+    t = trial_obj.tensor("foo_0")
+    t.value(0)
+    for reduction in ["min", "max", "mean", "l2"]:
+        t.reduction_value(0, reduction)
+    assert num_reads == 1
+
+
+@pytest.mark.parametrize("cache_size", ["0", "16"])
+def test_local_value_modified_by_caller(monkeypatch, cache_size):
+    monkeypatch.setenv(TENSOR_VALUE_CACHE_SIZE_KEY, cache_size)
+    trial_name = str(uuid.uuid4())
+    path = "ts_output/train/"
+    generate_data(
+        path=path,
+        trial=trial_name,
+        num_tensors=1,
+        step=2,
+        tname_prefix="foo",
+        worker="algo-1",
+        shape=(3, 3),
+        rank=0,
+    )
+    trial_obj = LocalTrial(name=trial_name, dirname=os.path.join(path, trial_name))
+    t = trial_obj.tensor("foo_0")
+    # values read are kept by the index reader, changing them must not change later reads
+    value = t.value(2)
+    value += 100
+    assert (t.value(2) == 2).all()
+    t.value(2)[0, 0] = -1
+    assert t.reduction_value(2, "min") == 2
+    assert (t.value(2) == 2).all()
+
+
+def test_local_values(monkeypatch):
+    monkeypatch.setenv(TENSOR_VALUE_CACHE_SIZE_KEY, "16")
+    trial_name = str(uuid.uuid4())
+    path = "ts_output/train/"
+    num_steps = 5
+    for i in range(num_steps):
+        generate_data(
+            path=path,
+            trial=trial_name,
+            num_tensors=2,
+            step=i,
+            tname_prefix="foo",
+            worker="algo-1",
+            shape=(3, 3),
+            rank=0,
+        )
+    trial_obj = LocalTrial(name=trial_name, dirname=os.path.join(path, trial_name))
+    values = trial_obj.tensor("foo_1").values()
+    assert list(values.keys()) == list(range(num_steps))
+    for step, value in values.items():
+        assert (value == step).all()
+    assert list(trial_obj.tensor("foo_1").values(steps=[3, 1]).keys()) == [3, 1]
+    # values read for many steps at once bypass the tensor value cache
+    assert len(trial_obj.index_reader._tensor_value_cache) == 0
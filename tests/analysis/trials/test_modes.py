@@ -1,7 +1,7 @@
 # Standard Library
 import shutil
 import socket
-from datetime import datetime
+import time
 
 # Third Party
 import numpy as np
@@ -20,7 +20,7 @@ def test_modes_on_global_data():
 
 
 def test_mode_data():
-    run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+    run_id = f"trial_{time.time_ns()}"
     trial_dir = "/tmp/ts_outputs/" + run_id
 
     c = CollectionManager()
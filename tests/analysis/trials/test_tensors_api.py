@@ -1,6 +1,6 @@
 # Standard Library
 import socket
-from datetime import datetime
+import time
 
 # Third Party
 import numpy as np
@@ -54,7 +54,7 @@ def test_tensors(out_dir):
 
 
 def test_mode_data():
-    run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+    run_id = f"trial_{time.time_ns()}"
     trial_dir = "/tmp/ts_outputs/" + run_id
 
     c = CollectionManager()
@@ -0,0 +1,151 @@
+# Standard Library
+import os
+import shutil
+import uuid
+
+# Third Party
+import pytest
+
+# First Party
+from smdebug.core.access_layer.file import TSAccessFile, _make_dir, get_write_buffer_size
+from smdebug.core.config_constants import WRITE_BUFFER_SIZE_DEFAULT, WRITE_BUFFER_SIZE_KEY
+from smdebug.core.tfrecord import _crc32c
+from smdebug.core.tfrecord.record_reader import RecordReader
+from smdebug.core.tfrecord.record_writer import RecordWriter
+
+
+def test_write_many_positions(out_dir):
+    path = os.path.join(out_dir, f"write_many_{uuid.uuid4()}.bin")
+    chunks = [b"abc", b"", b"defgh", b"ij"]
+    f = TSAccessFile(path, "wb")
+    assert f.write(b"0123") == [0, 4]
+    assert f.write_many(chunks) == [[4, 3], [7, 0], [7, 5], [12, 2]]
+    f.close()
+
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data == b"0123" + b"".join(chunks)
+
+
+def test_write_positions_past_buffer_size(out_dir, monkeypatch):
+    monkeypatch.setenv(WRITE_BUFFER_SIZE_KEY, "8")
+    path = os.path.join(out_dir, f"small_buffer_{uuid.uuid4()}.bin")
+    f = TSAccessFile(path, "wb")
+    assert f.write(b"0123") == [0, 4]
+    assert f.write(b"456789abcdef") == [4, 12]
+    f.flush()
+    assert f.write_many([b"gh", b"ijklmnop"]) == [[16, 2], [18, 8]]
+    f.close()
+
+    with open(path, "rb") as f:
+        assert f.read() == b"0123456789abcdefghijklmnop"
+
+
+@pytest.mark.parametrize("value", ["0", "1", "-5", "1MB"])
+def test_invalid_write_buffer_size(out_dir, monkeypatch, value):
+    monkeypatch.setenv(WRITE_BUFFER_SIZE_KEY, value)
+    assert get_write_buffer_size() == WRITE_BUFFER_SIZE_DEFAULT
+    # index files are opened in text mode, which can not be unbuffered
+    path = os.path.join(out_dir, f"invalid_buffer_{uuid.uuid4()}.json")
+    f = TSAccessFile(path, "a+")
+    f.write("{}")
+    f.close()
+    with open(path) as f:
+        assert f.read() == "{}"
+
+
+def test_write_many_larger_than_buffer(out_dir, monkeypatch):
+    monkeypatch.setenv(WRITE_BUFFER_SIZE_KEY, "8")
+    written = []
+
+    def writev(fd, bufs):
+        # write at most 5 bytes per call to exercise partial writes
+        data = b"".join(bytes(b) for b in bufs)[:5]
+        written.append(len(bufs))
+        return os.write(fd, data)
+
+    monkeypatch.setattr(os, "writev", writev)
+    path = os.path.join(out_dir, f"writev_{uuid.uuid4()}.bin")
+    chunks = [b"%d" % (i % 10) for i in range(2000)] + [b"", b"abcdefgh"]
+    f = TSAccessFile(path, "wb")
+    assert f.write(b"0123") == [0, 4]
+    positions = f.write_many(chunks)
+    f.close()
+
+    assert positions[-1] == [2004, 8]
+    assert written and max(written) <= 1024
+    with open(path, "rb") as f:
+        assert f.read() == b"0123" + b"".join(chunks)
+
+
+def test_write_after_directory_removed(out_dir):
+    path = os.path.join(out_dir, f"removed_{uuid.uuid4()}", "file.txt")
+    for _ in range(2):
+        f = TSAccessFile(path, "w")
+        f.write("data")
+        f.close()
+        with open(path) as f:
+            assert f.read() == "data"
+        # the directory is cached as existing, writing again should still succeed
+        shutil.rmtree(os.path.dirname(path))
+
+
+@pytest.mark.parametrize("data", [b"", b"0123456789"])
+def test_ingest_all_and_read(out_dir, data):
+    path = os.path.join(out_dir, f"ingest_{uuid.uuid4()}.bin")
+    f = TSAccessFile(path, "wb")
+    f.write(data)
+    f.close()
+
+    f = TSAccessFile(path, "rb")
+    f.ingest_all()
+    chunks = []
+    while f.has_data():
+        chunks.append(f.read(2))
+    f.close()
+    assert all(isinstance(c, bytes) for c in chunks)
+    assert b"".join(chunks) == data
+
+
+def test_record_writer_closed_when_collected(out_dir):
+    path = os.path.join(out_dir, f"records_{uuid.uuid4()}.tfevents")
+    writer = RecordWriter(path, write_checksum=True)
+    writer.write_record(b"abc")
+    # the file is written to a temporary path until the writer is closed
+    assert not os.path.exists(path)
+    del writer
+    assert RecordReader(path).read_record(check="full") == b"abc"
+
+    writer = RecordWriter(path, write_checksum=True)
+    writer.close()
+    writer.close()
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_crc32c(monkeypatch, native):
+    if not native:
+        monkeypatch.setattr(_crc32c, "_native_crc32c", None)
+    elif _crc32c._native_crc32c is None:
+        pytest.skip("no C implementation of crc32c installed")
+    assert _crc32c.crc32c(b"") == 0
+    assert _crc32c.crc32c(b"123456789") == 0xE3069283
+
+
+def test_ensured_dirs_bounded(out_dir):
+    # each step writes to directories of its own, which must not pile up in memory
+    for step in range(200):
+        path = os.path.join(out_dir, f"ensured_{uuid.uuid4()}", f"{step:012d}", "file.bin")
+        f = TSAccessFile(path, "wb")
+        f.close()
+        assert os.path.exists(path)
+    assert _make_dir.cache_info().currsize <= _make_dir.cache_info().maxsize
+
+
+def test_write_after_dir_removed(out_dir):
+    directory = os.path.join(out_dir, f"removed_{uuid.uuid4()}")
+    f = TSAccessFile(os.path.join(directory, "a.bin"), "wb")
+    f.close()
+    shutil.rmtree(directory)
+    f = TSAccessFile(os.path.join(directory, "b.bin"), "wb")
+    f.close()
+    assert os.path.exists(os.path.join(directory, "b.bin"))
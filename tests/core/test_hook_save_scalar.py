@@ -3,7 +3,7 @@ import json
 import logging
 import os
 import shutil
-from datetime import datetime
+import time
 
 # Third Party
 import mxnet as mx
@@ -306,7 +306,7 @@ def verify_files(out_dir, save_config, saved_scalars=None):
 def helper_pytorch_tests(collection, register_loss, save_config):
     coll_name, coll_regex = collection
 
-    run_id = "trial_" + coll_name + "-" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+    run_id = f"trial_{coll_name}-{time.time_ns()}"
     trial_dir = os.path.join(SMDEBUG_PT_HOOK_TESTS_DIR, run_id)
 
     hook = PT_Hook(
@@ -346,7 +346,7 @@ def test_pytorch_save_scalar(collection, save_config, register_loss):
 def helper_mxnet_tests(collection, register_loss, save_config):
     coll_name, coll_regex = collection
 
-    run_id = "trial_" + coll_name + "-" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+    run_id = f"trial_{coll_name}-{time.time_ns()}"
     trial_dir = os.path.join(SMDEBUG_MX_HOOK_TESTS_DIR, run_id)
 
     hook = MX_Hook(
@@ -386,7 +386,7 @@ def test_mxnet_save_scalar(collection, save_config, register_loss):
 def helper_tensorflow_tests(collection, save_config):
     coll_name, coll_regex = collection
 
-    run_id = "trial_" + coll_name + "-" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+    run_id = f"trial_{coll_name}-{time.time_ns()}"
     trial_dir = os.path.join(SMDEBUG_TF_HOOK_TESTS_DIR, run_id)
 
     hook = TF_Hook(
@@ -2,12 +2,14 @@
 import json
 import os
 import shutil
+import threading
 
 # Third Party
 import numpy as np
 
 # First Party
-from smdebug.core.locations import IndexFileLocationUtils, TensorFileLocation
+from smdebug.core.config_constants import EVENT_QUEUE_OVERFLOW_KEY
+from smdebug.core.locations import IndexFileLocationUtils, TensorFileLocation, TensorLocation
 from smdebug.core.reader import FileReader
 from smdebug.core.writer import FileWriter
 
@@ -55,3 +57,104 @@ def test_index():
     fo.close()
     shutil.rmtree(run_dir)
     os.remove("test.txt")
+
+
+def test_index_with_bounded_queue(tmpdir):
+    # more tensors than the queue holds, so the writer thread drains them in several batches
+    run_dir = str(tmpdir.join("bounded_queue"))
+    step = 0
+    worker = "worker_0"
+    writer = FileWriter(trial_dir=run_dir, step=step, worker=worker, max_queue=2)
+    for i in range(50):
+        writer.write_tensor(tdata=np.full((2, 2), i, dtype=np.float32), tname=f"tensor{i}")
+    writer.close()
+
+    efl = TensorFileLocation(step_num=step, worker_name=worker)
+    eventfile = efl.get_file_location(trial_dir=run_dir)
+    indexfile = IndexFileLocationUtils.get_index_key_for_step(run_dir, step, worker)
+    with open(indexfile) as idx_file:
+        tensor_payload = json.load(idx_file)["tensor_payload"]
+    assert [t["tensorname"] for t in tensor_payload] == [f"tensor{i}" for i in range(50)]
+
+    with open(eventfile, "rb") as fo:
+        for i, tensor in enumerate(tensor_payload):
+            fo.seek(int(tensor["start_idx"]))
+            record = fo.read(int(tensor["length"]))
+            record_file = tmpdir.join("record")
+            record_file.write_binary(record)
+            tensor_values = list(FileReader(str(record_file)).read_tensors())
+            assert tensor_values[0][0] == f"tensor{i}"
+            assert np.all(tensor_values[0][2] == i)
+
+
+def test_index_with_concurrent_writers(tmpdir):
+    # events are written inline by the callers when the writer thread is idle,
+    # and queued for it otherwise
+    run_dir = str(tmpdir.join("concurrent_writers"))
+    step = 0
+    worker = "worker_0"
+    writer = FileWriter(trial_dir=run_dir, step=step, worker=worker, max_queue=2)
+
+    def write_tensors(first):
+        for i in range(first, first + 50):
+            writer.write_tensor(tdata=np.full((2, 2), i, dtype=np.float32), tname=f"tensor{i}")
+
+    threads = [threading.Thread(target=write_tensors, args=(first,)) for first in (0, 50, 100)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close()
+
+    efl = TensorFileLocation(step_num=step, worker_name=worker)
+    eventfile = efl.get_file_location(trial_dir=run_dir)
+    indexfile = IndexFileLocationUtils.get_index_key_for_step(run_dir, step, worker)
+    with open(indexfile) as idx_file:
+        tensor_payload = json.load(idx_file)["tensor_payload"]
+    assert sorted(int(t["tensorname"][len("tensor") :]) for t in tensor_payload) == list(range(150))
+
+    with open(eventfile, "rb") as fo:
+        for tensor in tensor_payload:
+            fo.seek(int(tensor["start_idx"]))
+            record = fo.read(int(tensor["length"]))
+            record_file = tmpdir.join("record")
+            record_file.write_binary(record)
+            tensor_values = list(FileReader(str(record_file)).read_tensors())
+            assert tensor_values[0][0] == tensor["tensorname"]
+            assert np.all(tensor_values[0][2] == int(tensor["tensorname"][len("tensor") :]))
+
+
+def test_index_with_dropped_events(tmpdir, monkeypatch):
+    monkeypatch.setenv(EVENT_QUEUE_OVERFLOW_KEY, "drop")
+    run_dir = str(tmpdir.join("dropped_events"))
+    step = 0
+    worker = "worker_0"
+    writer = FileWriter(trial_dir=run_dir, step=step, worker=worker, max_queue=1)
+    event_file_writer = writer._writer
+    # keep the writer thread from writing, so that the queue fills up
+    with event_file_writer._worker._write_lock:
+        for i in range(10):
+            writer.write_tensor(tdata=np.full((2, 2), i, dtype=np.float32), tname=f"tensor{i}")
+        num_dropped = event_file_writer.num_dropped_events
+    writer.close()
+    # the thread holds one batch and the queue one event, so at most two are kept
+    assert num_dropped >= 8
+
+    indexfile = IndexFileLocationUtils.get_index_key_for_step(run_dir, step, worker)
+    with open(indexfile) as idx_file:
+        tensor_payload = json.load(idx_file)["tensor_payload"]
+    assert len(tensor_payload) == 10 - num_dropped
+
+
+def test_tensor_location_to_json():
+    for tname in ["gradients/dense/kernel:0", 'quoted "name"\\', "ünïcode\n"]:
+        tl = TensorLocation(
+            tname=tname,
+            mode="TRAIN",
+            mode_step=3,
+            event_file_name="events/000000000003/000000000003_worker_0.tfevents",
+            start_idx=1 << 40,
+            length=0,
+            worker="worker_0",
+        )
+        assert tl.to_json() == json.dumps(tl.to_dict())
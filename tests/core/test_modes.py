@@ -2,7 +2,7 @@
 import glob
 import shutil
 import socket
-from datetime import datetime
+import time
 
 # Third Party
 import numpy as np
@@ -18,7 +18,7 @@ from .utils import write_dummy_collection_file
 
 
 def test_mode_writing():
-    run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+    run_id = f"trial_{time.time_ns()}"
     worker = socket.gethostname()
     for s in range(0, 10):
         fw = FileWriter(trial_dir="/tmp/ts_outputs/" + run_id, step=s, worker=worker)
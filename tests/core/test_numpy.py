@@ -6,7 +6,10 @@ import numpy as np
 import pytest
 
 # First Party
+from smdebug.core.modes import ModeKeys
 from smdebug.core.reader import FileReader
+from smdebug.core.tfevent.proto.event_pb2 import Event
+from smdebug.core.tfevent.util import make_tensor_proto, serialize_tensor_event
 from smdebug.core.writer import FileWriter
 
 
@@ -63,3 +66,75 @@ def test_string():
     assert len(read) == 1
     s_read = np.array(read[0][2])
     assert np.all(s_written == s_read)
+
+
+def test_tuple_and_scalar(out_dir):
+    with FileWriter(trial_dir=out_dir + "/my_trial", step=20, worker="algo-1") as fw:
+        fname = fw.name()
+        fw.write_tensor(tdata=(1.0, 2.0, 3.0), tname="foo_tuple")
+        fw.write_tensor(tdata=np.float32(4.0), tname="foo_scalar")
+
+    fr = FileReader(fname=fname)
+    read = list(fr.read_tensors())
+    assert np.all(read[0][2] == np.array([1.0, 2.0, 3.0]))
+    assert np.all(read[1][2] == np.array([4.0], dtype=np.float32))
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.float16,
+        np.float64,
+        np.int8,
+        np.int16,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.complex64,
+        np.complex128,
+        np.bool_,
+    ],
+)
+def test_dtypes(out_dir, dtype):
+    with FileWriter(trial_dir=out_dir + "/my_trial", step=20, worker="algo-1") as fw:
+        fname = fw.name()
+        data = np.arange(12).reshape(3, 4).astype(dtype)
+        # a non contiguous view is written in C order
+        fw.write_tensor(tdata=data.T, tname="foo")
+
+    read = list(FileReader(fname=fname).read_tensors())
+    assert read[0][2].dtype == dtype
+    assert np.array_equal(read[0][2], data.T)
+
+
+@pytest.mark.parametrize("shape", [(), (0,), (3, 4), (2, 0, 5), (1, 1, 300)])
+@pytest.mark.parametrize("step", [0, 20, -1, 1 << 40])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int64, np.bool_])
+def test_serialize_tensor_event(shape, step, dtype):
+    data = np.ones(shape, dtype=dtype)
+    metadata = FileWriter._get_metadata(ModeKeys.TRAIN, step)
+    for wall_time, tag in [(0.0, ""), (1587139213.123456, "foo/bar_ä")]:
+        event = Event(wall_time=wall_time, step=step)
+        summary_value = event.summary.value.add(tag=tag)
+        summary_value.metadata.CopyFrom(metadata)
+        make_tensor_proto(nparray_data=data, tag=tag, tensor_proto=summary_value.tensor)
+        event_str = serialize_tensor_event(wall_time, step, tag, metadata.SerializeToString(), data)
+        assert event_str == event.SerializeToString()
+
+
+def test_serialize_tensor_event_string():
+    assert serialize_tensor_event(0.0, 0, "foo", b"", np.array(["foo"])) is None
+
+
+@pytest.mark.parametrize("step", [np.int32(7), np.int64(7)])
+def test_numpy_integer_step(out_dir, step):
+    with FileWriter(trial_dir=out_dir + "/my_trial", step=step, worker="algo-1") as fw:
+        fname = fw.name()
+        fw.write_tensor(tdata=np.ones(3, dtype=np.float32), tname="foo")
+
+    read = list(FileReader(fname=fname).read_tensors())
+    assert read[0][0] == "foo"
+    assert read[0][1] == 7
+    assert np.all(read[0][2] == 1)
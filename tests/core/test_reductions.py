@@ -0,0 +1,97 @@
+# Standard Library
+import threading
+
+# Third Party
+import numpy as np
+import pytest
+
+# First Party
+from smdebug.core.modes import ModeKeys
+from smdebug.core.reductions import get_basic_numpy_reduction, get_numpy_reduction
+from smdebug.core.tensor import ModeSteps, Step
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32])
+@pytest.mark.parametrize("shape", [(1000,), (10, 10)])
+@pytest.mark.parametrize("reduction_name", ["min", "max", "mean", "l1", "l2"])
+@pytest.mark.parametrize("abs", [False, True])
+def test_reduction_matches_numpy(dtype, shape, reduction_name, abs):
+    data = (np.random.standard_normal(shape) * 10).astype(dtype)
+    rv = get_numpy_reduction(reduction_name, data, abs)
+    expected = get_basic_numpy_reduction(reduction_name, np.absolute(data) if abs else data)
+    assert np.allclose(rv, expected, rtol=1e-5)
+
+
+def test_reductions_from_several_threads():
+    # hooks reduce tensors from several threads at once
+    data = np.random.standard_normal(1 << 16).astype(np.float32)
+    expected = {r: get_basic_numpy_reduction(r, data) for r in ("l1", "l2")}
+    errors = []
+
+    def reduce():
+        try:
+            for _ in range(20):
+                for reduction_name, value in expected.items():
+                    rv = get_numpy_reduction(reduction_name, data)
+                    assert np.allclose(rv, value, rtol=1e-4)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=reduce) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+def test_mode_steps_reductions_grow():
+    mode_steps = ModeSteps(ModeKeys.TRAIN)
+    # more steps than the initial rows of the reduction storage
+    for step in range(20):
+        mode_steps.set_step_reduction_value(step, "worker_0", "max", False, float(step))
+    # a new reduction added once rows exist
+    mode_steps.set_step_reduction_value(3, "worker_0", "min", False, -3.0)
+    for step in range(20):
+        s = mode_steps.step(step)["worker_0"]
+        assert s.reduction_value("max", False) == step
+    assert mode_steps.step(3)["worker_0"].reduction_values() == {
+        ("max", False): 3.0,
+        ("min", False): -3.0,
+    }
+    assert mode_steps.step(4)["worker_0"].reduction_value("min", False) is None
+    assert mode_steps.step(4)["worker_0"].reduction_values() == {("max", False): 4.0}
+
+
+def test_mode_steps_reductions_abs():
+    mode_steps = ModeSteps(ModeKeys.TRAIN)
+    mode_steps.set_step_reduction_value(0, "worker_0", "min", False, -2.0)
+    mode_steps.set_step_reduction_value(0, "worker_0", "min", True, 1.0)
+    s = mode_steps.step(0)["worker_0"]
+    assert s.reduction_value("min", False) == -2.0
+    assert s.reduction_value("min", True) == 1.0
+    assert s.reduction_value("max", True) is None
+
+
+def test_mode_steps_reductions_keep_values():
+    mode_steps = ModeSteps(ModeKeys.TRAIN)
+    # NaN is a reduction value like any other, arrays keep their dtype and shape
+    values = {
+        ("max", False): np.array([7], dtype=np.int32),
+        ("min", False): np.int64(-1),
+        ("mean", False): np.float32(np.nan),
+    }
+    for (red_name, abs), value in values.items():
+        mode_steps.set_step_reduction_value(0, "worker_0", red_name, abs, value)
+    s = mode_steps.step(0)["worker_0"]
+    for key, value in values.items():
+        assert s.reduction_value(*key) is value
+    assert s.reduction_values() == values
+
+
+def test_step_without_reductions():
+    s = Step(5)
+    assert s.reduction_value("max", False) is None
+    assert s.reduction_values() == {}
+    s.set_reduction_value("max", False, 2.5)
+    assert s.reduction_value("max", False) == 2.5
@@ -13,7 +13,7 @@ from smdebug.core.json_config import (
     get_json_config_as_dict,
 )
 from smdebug.core.locations import IndexFileLocationUtils
-from smdebug.core.utils import SagemakerSimulator, is_s3
+from smdebug.core.utils import SagemakerSimulator, is_s3, match_inc
 
 
 def test_normal():
@@ -149,3 +149,15 @@ def test_json_params_sagemaker():
         assert len(include_collections) == 2
         assert hook_params["export_tensorboard"] == True
         assert hook_params["tensorboard_dir"] == sim.tensorboard_dir
+
+
+def test_match_inc():
+    assert match_inc("dense/kernel:0", ["conv", "kernel"])
+    assert match_inc("dense/kernel:0", ["^dense/.*:0$"])
+    assert not match_inc("dense/bias:0", ["conv", "kernel"])
+    assert not match_inc("dense/bias:0", [])
+    # patterns with global flags apply them to themselves only
+    assert match_inc("Dense/bias:0", ["(?i)dense", "kernel"])
+    assert not match_inc("Kernel", ["(?i)dense", "kernel"])
+    # backreferences refer to groups of their own pattern
+    assert match_inc("aa", ["(b)", r"(a)\1"])
@@ -1,7 +1,5 @@
 # Standard Library
-import os
-import shutil
-from datetime import datetime
+import json
 
 # First Party
 from smdebug import SaveConfig
@@ -13,41 +11,46 @@ from smdebug.mxnet.hook import Hook as t_hook
 from .mnist_gluon_model import run_mnist_gluon_model
 
 
-def test_hook():
+def write_json_config(tmpdir, config_path, out_dir):
+    with open(config_path) as f:
+        config = json.load(f)
+    config["LocalPath"] = str(out_dir)
+    config_file = tmpdir.join("config.json")
+    config_file.write(json.dumps(config))
+    return str(config_file)
+
+
+def test_hook(tmpdir):
     save_config = SaveConfig(save_steps=[0, 1, 2, 3])
-    run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
-    out_dir = "/tmp/newlogsRunTest/" + run_id
+    out_dir = str(tmpdir.join("test_hook"))
     hook = t_hook(out_dir=out_dir, save_config=save_config)
     assert has_training_ended(out_dir) == False
     run_mnist_gluon_model(
         hook=hook, num_steps_train=10, num_steps_eval=10, register_to_loss_block=True
     )
-    shutil.rmtree(out_dir)
 
 
-def test_hook_from_json_config():
-    out_dir = "/tmp/newlogsRunTest1/test_hook_from_json_config"
-    shutil.rmtree(out_dir, True)
-    os.environ[
-        CONFIG_FILE_PATH_ENV_STR
-    ] = "tests/mxnet/test_json_configs/test_hook_from_json_config.json"
+def test_hook_from_json_config(tmpdir, monkeypatch):
+    out_dir = str(tmpdir.join("test_hook_from_json_config"))
+    config_file = write_json_config(
+        tmpdir, "tests/mxnet/test_json_configs/test_hook_from_json_config.json", out_dir
+    )
+    monkeypatch.setenv(CONFIG_FILE_PATH_ENV_STR, config_file)
     hook = t_hook.create_from_json_file()
     assert has_training_ended(out_dir) == False
     run_mnist_gluon_model(
         hook=hook, num_steps_train=10, num_steps_eval=10, register_to_loss_block=True
     )
-    shutil.rmtree(out_dir, True)
 
 
-def test_hook_from_json_config_full():
-    out_dir = "/tmp/newlogsRunTest2/test_hook_from_json_config_full"
-    shutil.rmtree(out_dir, True)
-    os.environ[
-        CONFIG_FILE_PATH_ENV_STR
-    ] = "tests/mxnet/test_json_configs/test_hook_from_json_config_full.json"
+def test_hook_from_json_config_full(tmpdir, monkeypatch):
+    out_dir = str(tmpdir.join("test_hook_from_json_config_full"))
+    config_file = write_json_config(
+        tmpdir, "tests/mxnet/test_json_configs/test_hook_from_json_config_full.json", out_dir
+    )
+    monkeypatch.setenv(CONFIG_FILE_PATH_ENV_STR, config_file)
     hook = t_hook.create_from_json_file()
     assert has_training_ended(out_dir) == False
     run_mnist_gluon_model(
         hook=hook, num_steps_train=10, num_steps_eval=10, register_to_loss_block=True
     )
-    shutil.rmtree(out_dir, True)
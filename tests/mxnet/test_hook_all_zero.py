@@ -1,6 +1,6 @@
 # Standard Library
 import shutil
-from datetime import datetime
+import time
 
 # Third Party
 import numpy as np
@@ -19,7 +19,7 @@ def test_hook_all_zero(hook=None, out_dir=None):
     if hook is None:
         hook_created = True
         save_config = SaveConfig(save_steps=[0, 1, 2, 3])
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         out_dir = "/tmp/newlogsRunTest/" + run_id
         print("Registering the hook with out_dir {0}".format(out_dir))
         shutil.rmtree(out_dir, ignore_errors=True)
@@ -1,7 +1,3 @@
-# Standard Library
-import shutil
-from datetime import datetime
-
 # First Party
 from smdebug import SaveConfig
 from smdebug.core.access_layer.utils import has_training_ended
@@ -12,10 +8,9 @@ from smdebug.trials import create_trial
 from .mnist_gluon_model import run_mnist_gluon_model
 
 
-def test_loss_collection_default():
+def test_loss_collection_default(tmpdir):
     save_config = SaveConfig(save_steps=[0, 1, 2, 3])
-    run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
-    out_dir = "/tmp/" + run_id
+    out_dir = str(tmpdir.join("test_loss_collection_default"))
     hook = t_hook(out_dir=out_dir, save_config=save_config)
     assert has_training_ended(out_dir) == False
     run_mnist_gluon_model(
@@ -36,13 +31,11 @@ def test_loss_collection_default():
     # Assert that we are not logging the inputs to loss block.
     input_loss_tensors = tr.tensor_names(regex=".*loss._input*")
     assert len(input_loss_tensors) == 0
-    shutil.rmtree(out_dir)
 
 
-def test_loss_collection_with_no_other_collections():
+def test_loss_collection_with_no_other_collections(tmpdir):
     save_config = SaveConfig(save_steps=[0, 1, 2, 3])
-    run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
-    out_dir = "/tmp/" + run_id
+    out_dir = str(tmpdir.join("test_loss_collection_with_no_other_collections"))
     hook = t_hook(out_dir=out_dir, save_config=save_config, include_collections=[])
     assert has_training_ended(out_dir) == False
     run_mnist_gluon_model(
@@ -59,5 +52,3 @@ def test_loss_collection_with_no_other_collections():
     loss_tensor = tr.tensor(tname)
     loss_val = loss_tensor.value(step_num=1)
     assert len(loss_val) > 0
-
-    shutil.rmtree(out_dir)
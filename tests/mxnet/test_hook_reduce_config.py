@@ -1,6 +1,6 @@
 # Standard Library
 import shutil
-from datetime import datetime
+import time
 
 # First Party
 from smdebug.mxnet import ReductionConfig, SaveConfig
@@ -18,7 +18,7 @@ def test_save_config(hook=None, out_dir=None):
         global_reduce_config = ReductionConfig(reductions=["max", "mean"])
         global_save_config = SaveConfig(save_steps=[0, 1, 2, 3])
 
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         out_dir = "/tmp/newlogsRunTest/" + run_id
         print("Registering the hook with out_dir {0}".format(out_dir))
         hook = t_hook(
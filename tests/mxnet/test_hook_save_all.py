@@ -1,6 +1,6 @@
 # Standard Library
 import shutil
-from datetime import datetime
+import time
 
 # First Party
 from smdebug.mxnet import SaveConfig
@@ -16,7 +16,7 @@ def test_save_all(hook=None, out_dir=None):
     if hook is None:
         hook_created = True
         save_config = SaveConfig(save_steps=[0, 1, 2, 3])
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         out_dir = "/tmp/" + run_id
         print("Registering the hook with out_dir {}".format(out_dir))
         hook = t_hook(out_dir=out_dir, save_config=save_config, save_all=True)
@@ -1,7 +1,7 @@
 # Standard Library
 import os
 import shutil
-from datetime import datetime
+import time
 
 # First Party
 from smdebug.mxnet import SaveConfig
@@ -14,7 +14,7 @@ from .mnist_gluon_model import run_mnist_gluon_model
 def test_save_config(hook=None):
     if hook is None:
         save_config_collection = SaveConfig(save_steps=[4, 5, 6])
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         out_dir = "/tmp/" + run_id
         save_config = SaveConfig(save_steps=[0, 1, 2, 3])
         hook = t_hook(
@@ -1,5 +1,5 @@
 # Standard Library
-from datetime import datetime
+import time
 
 # First Party
 from smdebug import modes
@@ -13,7 +13,7 @@ from .mnist_gluon_model import run_mnist_gluon_model
 
 def test_modes(hook=None, path=None):
     if hook is None:
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         path = "/tmp/" + run_id
         hook = t_hook(
             out_dir=path,
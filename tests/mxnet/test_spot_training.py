@@ -4,7 +4,6 @@
 import os
 import shutil
 import time
-from datetime import datetime
 
 # Third Party
 import mxnet as mx
@@ -139,7 +138,7 @@ def run_mnist(
 
 
 @pytest.mark.slow  # 0:01 to run
-def test_spot_hook():
+def test_spot_hook(tmpdir):
     os.environ[
         CHECKPOINT_CONFIG_FILE_PATH_ENV_VAR
     ] = "./tests/mxnet/test_json_configs/checkpointconfig.json"
@@ -153,8 +152,7 @@ def test_spot_hook():
     We expect that steps 0 to 14 will be written.
     """
 
-    run_id_1 = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
-    out_dir_1 = "/tmp/newlogsRunTest/" + run_id_1
+    out_dir_1 = str(tmpdir.join("trial_1"))
     hook = t_hook(
         out_dir=out_dir_1, save_config=save_config, include_collections=["weights", "gradients"]
     )
@@ -173,8 +171,7 @@ def test_spot_hook():
     We DONOT expect that steps 0 to 14 are written.
     We expect to read steps 40, 50, 60, 70 and 80
     """
-    run_id_2 = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
-    out_dir_2 = "/tmp/newlogsRunTest/" + run_id_2
+    out_dir_2 = str(tmpdir.join("trial_2"))
     hook = t_hook(
         out_dir=out_dir_2, save_config=save_config, include_collections=["weights", "gradients"]
     )
@@ -215,5 +212,4 @@ def test_spot_hook():
     print(available_steps_2)
 
     print("Cleaning up.")
-    shutil.rmtree(os.path.dirname(out_dir_1))
     shutil.rmtree(checkpoint_path, ignore_errors=True)
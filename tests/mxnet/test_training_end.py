@@ -1,5 +1,4 @@
 # Standard Library
-import shutil
 import subprocess
 import sys
 import uuid
@@ -13,9 +12,8 @@ from smdebug.core.access_layer.utils import has_training_ended
 
 
 @pytest.mark.slow  # 0:03 to run
-def test_end_local_training():
-    run_id = str(uuid.uuid4())
-    out_dir = "/tmp/newlogsRunTest/" + run_id
+def test_end_local_training(tmpdir):
+    out_dir = str(tmpdir.join("test_end_local_training"))
     assert has_training_ended(out_dir) == False
     subprocess.check_call(
         [
@@ -28,7 +26,6 @@ def test_end_local_training():
         ]
     )
     assert has_training_ended(out_dir)
-    shutil.rmtree(out_dir)
 
 
 @pytest.mark.slow  # 0:04 to run
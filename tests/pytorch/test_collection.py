@@ -1,6 +1,6 @@
 # Standard Library
 import shutil
-from datetime import datetime
+import time
 
 # Third Party
 import torch
@@ -18,7 +18,7 @@ from .utils import Net, train
 def test_collection_add(hook=None, out_dir=None):
     hook_created = False
     if hook is None:
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         out_dir = "/tmp/" + run_id
         hook = t_hook(
             out_dir=out_dir,
@@ -1,7 +1,7 @@
 # Standard Library
 import os
 import shutil
-from datetime import datetime
+import time
 
 # Third Party
 import torch
@@ -22,7 +22,7 @@ def test_reduce_config(hook=None, out_dir=None):
         global_reduce_config = ReductionConfig(reductions=["max", "mean", "variance"])
         global_save_config = SaveConfig(save_steps=[0, 1, 2, 3])
 
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         out_dir = "/tmp/" + run_id
         hook = t_hook(
             out_dir=out_dir,
@@ -11,7 +11,7 @@ Integration tests with S3 take 95% of the time.
 
 # Standard Library
 import shutil
-from datetime import datetime
+import time
 
 # Third Party
 import numpy as np
@@ -103,10 +103,12 @@ def help_test_mnist(
     # Load training and eval data
     ((train_data, train_labels), (eval_data, eval_labels)) = tf.keras.datasets.mnist.load_data()
 
-    train_data = train_data / np.float32(255)
+    # scale straight into a float32 array, without an intermediate copy of the data
+    scale = np.float32(1 / 255)
+    train_data = np.multiply(train_data, scale, dtype=np.float32)
     train_labels = train_labels.astype(np.int32)  # not required
 
-    eval_data = eval_data / np.float32(255)
+    eval_data = np.multiply(eval_data, scale, dtype=np.float32)
     eval_labels = eval_labels.astype(np.int32)  # not required
 
     mnist_classifier = tf.estimator.Estimator(
@@ -179,7 +181,7 @@ def helper_test_mnist_trial(trial_dir):
 @pytest.mark.slow  # 0:02 to run
 def test_mnist(out_dir, on_s3=False):
     if on_s3:
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         bucket = "smdebug-testing"
         prefix = "outputs/hooks/estimator_modes/" + run_id
         out_dir = f"s3://{bucket}/{prefix}"
@@ -222,7 +224,7 @@ def helper_test_multi_save_configs_trial(trial_dir):
 def test_mnist_local_multi_save_configs(out_dir, on_s3=False):
     # Runs in 0:04
     if on_s3:
-        run_id = "trial_" + datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        run_id = f"trial_{time.time_ns()}"
         bucket = "smdebug-testing"
         prefix = "outputs/hooks/estimator_modes/" + run_id
         out_dir = f"s3://{bucket}/{prefix}"